@@ -0,0 +1,139 @@
+"""Measure how long Home Assistant takes to import the integration.
+
+Each round starts a fresh interpreter, imports what Home Assistant has
+already loaded by the time integrations are set up (``homeassistant.bootstrap``
+plus the Home Assistant modules the integration imports), and then times
+importing the integration package and its platforms in the order Home
+Assistant loads them. Only the integration's own cost is measured.
+
+Results are compared with ``import_baseline.json``. A slower import than
+the allowed tolerance is reported as a regression (exit status 1), and so
+is a module-level import of any of HEAVY_MODULES: they are only needed on
+first use. That check reads the source, since Home Assistant itself may
+already have imported them.
+
+    python benchmarks/bench_import.py                 # compare with baseline
+    python benchmarks/bench_import.py --save-baseline # record a new baseline
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+BASELINE = ROOT / "import_baseline.json"
+COMPONENT = ROOT.parent / "custom_components" / "arris_cablemodem"
+
+# Modules of the integration, in the order Home Assistant imports them
+MODULES = ("", ".config_flow", ".binary_sensor", ".sensor", ".diagnostics")
+
+# Dependencies that must not be imported when the integration loads
+HEAVY_MODULES = ("requests", "urllib3", "charset_normalizer", "bs4")
+
+CHILD = """
+import importlib, json, sys, time
+import homeassistant.bootstrap
+for name in {preload!r}:
+    importlib.import_module(name)
+sys.path.insert(0, {root!r})
+timings = {{}}
+for module in {modules!r}:
+    start = time.perf_counter()
+    importlib.import_module("custom_components.arris_cablemodem" + module)
+    timings[module or "__init__"] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+
+def imported_modules(tree: ast.AST) -> set[str]:
+    """Return the absolute imports found in a syntax tree."""
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module)
+        elif isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+    return modules
+
+
+def home_assistant_imports() -> list[str]:
+    """Return the Home Assistant modules the integration imports."""
+    modules = set()
+    for path in COMPONENT.rglob("*.py"):
+        modules |= imported_modules(ast.parse(path.read_text()))
+    return sorted(name for name in modules if name.split(".")[0] == "homeassistant")
+
+
+def heavy_module_level_imports() -> list[str]:
+    """Return every module-level import of HEAVY_MODULES, as ``file: module``."""
+    found = []
+    for path in sorted(COMPONENT.rglob("*.py")):
+        for node in ast.parse(path.read_text()).body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                continue
+            for module in sorted(imported_modules(node)):
+                if module.split(".")[0] in HEAVY_MODULES:
+                    found.append(f"{path.relative_to(COMPONENT)}: {module}")
+    return found
+
+
+def measure_round(preload: list[str]) -> dict:
+    """Import the integration once in a fresh interpreter."""
+    script = CHILD.format(
+        preload=preload,
+        root=str(COMPONENT.parents[1]),
+        modules=MODULES,
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=15, help="fresh interpreters to time")
+    parser.add_argument("--save-baseline", action="store_true", help="write import_baseline.json")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="allowed slowdown (0.5 = 50%%)")
+    args = parser.parse_args()
+
+    preload = home_assistant_imports()
+    rounds = [measure_round(preload) for _ in range(args.rounds)]
+    results = {
+        name: round(statistics.median(timings[name] for timings in rounds), 3)
+        for name in rounds[0]
+    }
+    results["total"] = round(sum(results.values()), 3)
+
+    print(f"{'module':<20} {'median ms':>10}")
+    for name, median in results.items():
+        print(f"{name:<20} {median:>10.3f}")
+
+    regressions = [
+        f"{found} is imported at module level" for found in heavy_module_level_imports()
+    ]
+
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {BASELINE}")
+    elif not BASELINE.exists():
+        print("No baseline stored; run with --save-baseline to record one")
+    else:
+        baseline = json.loads(BASELINE.read_text())
+        for name, median in results.items():
+            if name in baseline and median > baseline[name] * (1 + args.time_tolerance):
+                regressions.append(f"{name}: median {median} ms > baseline {baseline[name]} ms")
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
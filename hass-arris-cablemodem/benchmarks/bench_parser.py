@@ -0,0 +1,123 @@
+"""Benchmark status page parsing against captured modem pages.
+
+Parses every page in ``captures/`` with ``ArrisModem.parse_status`` (the
+parsing half of ``async_get_status``) and reports wall time, allocated memory
+blocks and peak memory per capture. Results are compared with
+``baseline.json`` and any capture slower or hungrier than the allowed
+tolerance is reported as a regression (exit status 1).
+
+    python -m benchmarks.bench_parser                 # compare with baseline
+    python -m benchmarks.bench_parser --save-baseline # record a new baseline
+
+Timings depend on the machine, so record the baseline on the same host the
+comparison runs on.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from devtools import load_component_module
+
+ROOT = Path(__file__).resolve().parent
+CAPTURES = ROOT / "captures"
+BASELINE = ROOT / "baseline.json"
+
+
+def bench_capture(modem, html: str, rounds: int) -> dict:
+    """Time and measure parsing one capture."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        modem.parse_status(html)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    status = modem.parse_status(html)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 4),
+        "min_ms": round(min(timings) * 1000, 4),
+        "blocks": blocks,
+        "peak_kib": round(peak / 1024, 1),
+        "downstream": len(status["downstream"]),
+        "upstream": len(status["upstream"]),
+    }
+
+
+def compare(results: dict, baseline: dict, time_tolerance: float, memory_tolerance: float) -> list[str]:
+    """Return a description of every regression against the baseline."""
+    regressions = []
+    for name, result in results.items():
+        if (base := baseline.get(name)) is None:
+            continue
+        if result["median_ms"] > base["median_ms"] * (1 + time_tolerance):
+            regressions.append(
+                f"{name}: median {result['median_ms']} ms > baseline {base['median_ms']} ms"
+            )
+        if result["peak_kib"] > base["peak_kib"] * (1 + memory_tolerance):
+            regressions.append(
+                f"{name}: peak {result['peak_kib']} KiB > baseline {base['peak_kib']} KiB"
+            )
+        if result["blocks"] > base["blocks"] * (1 + memory_tolerance):
+            regressions.append(
+                f"{name}: {result['blocks']} blocks > baseline {base['blocks']} blocks"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200, help="parses per capture")
+    parser.add_argument("--save-baseline", action="store_true", help="write baseline.json")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10, help="allowed memory growth")
+    args = parser.parse_args()
+
+    modem_class = load_component_module("modem").ArrisModem
+
+    # One modem per capture, so after the first parse each uses its model's parser
+    results = {}
+    for capture in sorted(CAPTURES.glob("*.html")):
+        results[capture.name] = bench_capture(
+            modem_class("benchmark"), capture.read_text(), args.rounds
+        )
+
+    print(f"{'capture':<20} {'median ms':>10} {'min ms':>10} {'blocks':>8} {'peak KiB':>9} {'ds':>4} {'us':>4}")
+    for name, result in results.items():
+        print(
+            f"{name:<20} {result['median_ms']:>10.3f} {result['min_ms']:>10.3f} "
+            f"{result['blocks']:>8} {result['peak_kib']:>9.1f} "
+            f"{result['downstream']:>4} {result['upstream']:>4}"
+        )
+
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {BASELINE}")
+        return 0
+
+    if not BASELINE.exists():
+        print("No baseline stored; run with --save-baseline to record one")
+        return 0
+
+    regressions = compare(
+        results, json.loads(BASELINE.read_text()), args.time_tolerance, args.memory_tolerance
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
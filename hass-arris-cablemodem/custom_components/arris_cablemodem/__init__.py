@@ -2,63 +2,113 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 
-import async_timeout
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .modem import ArrisModem
+from .const import (
+    CONF_METRICS,
+    CONF_MODEL,
+    DATA_POLLER,
+    DOMAIN,
+    EVENT_LOG_STORAGE_KEY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .coordinator import ArrisDataUpdateCoordinator
+from .metrics import async_register_metrics_view
+from .poller import ArrisFleetPoller
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the ARRIS SB6183 component."""
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ARRIS SB6183 from a config entry."""
-    host = entry.data["host"]
-    
-    modem = ArrisModem(host)
-    
-    async def async_update_data():
-        """Fetch data from modem."""
-        try:
-            async with async_timeout.timeout(10):
-                return await hass.async_add_executor_job(modem.get_status)
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with modem: {err}") from err
-    
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="arris_sb6183",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=60),
-    )
-    
-    await coordinator.async_config_entry_first_refresh()
-    
-    hass.data.setdefault(DOMAIN, {})
+    coordinator = await async_setup_coordinator(hass, entry)
     hass.data[DOMAIN][entry.entry_id] = coordinator
-    
+
+    # Remember the identified model so later setups skip detection
+    if (model := coordinator.modem.model) != entry.data.get(CONF_MODEL):
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_MODEL: model}
+        )
+
+    if entry.options.get(CONF_METRICS):
+        async_register_metrics_view(hass)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_setup_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ArrisDataUpdateCoordinator:
+    """Create the coordinator of a config entry and start polling it."""
+    host = entry.data["host"]
+
+    hass.data.setdefault(DOMAIN, {})
+    if (poller := hass.data[DOMAIN].get(DATA_POLLER)) is None:
+        poller = hass.data[DOMAIN][DATA_POLLER] = ArrisFleetPoller(hass)
+
+    # The poller owns the modem and its shared keep-alive session
+    modem = poller.async_add_modem(
+        entry.entry_id,
+        host,
+        entry.data.get(CONF_MODEL),
+        entry.data.get(CONF_USERNAME),
+        entry.data.get(CONF_PASSWORD),
+    )
+
+    coordinator = ArrisDataUpdateCoordinator(hass, poller, modem, entry)
+
+    # With a saved status, entities are created from it and the first live
+    # refresh is the first poll, due in the entry's next poll slot
+    if await coordinator.async_restore():
+        poller.async_start(entry.entry_id, coordinator, 0)
+        return coordinator
+
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        poller.async_remove(entry.entry_id)
+        raise
+
+    poller.async_start(entry.entry_id, coordinator)
+    return coordinator
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-    
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN][DATA_POLLER].async_remove(entry.entry_id)
+        await coordinator.async_shutdown()
+
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the saved status and event log index of a removed config entry."""
+    for key in (STORAGE_KEY, EVENT_LOG_STORAGE_KEY):
+        store = Store(hass, STORAGE_VERSION, key.format(entry.entry_id))
+        await store.async_remove()
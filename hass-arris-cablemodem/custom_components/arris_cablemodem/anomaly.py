@@ -0,0 +1,116 @@
+"""Per-channel anomaly detection for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+from array import array
+
+from .models import DownstreamChannel
+
+
+class ChannelAnomalyDetector:
+    """Compare every downstream channel with its own rolling baseline.
+
+    Each channel keeps, in a slot of ``array('d')`` columns, exponentially
+    weighted moving averages of its SNR and of its uncorrectable codeword
+    rate (per minute), plus the last counter value and when it was read.
+    ``update()`` evaluates all channels in a single pass per poll.
+
+    A channel is reported once it has ``warmup`` samples and either its
+    SNR is ``snr_drop`` dB or more below its baseline, or its error rate is
+    at least ``error_rate`` and ``spike_factor`` times its baseline. An
+    uncorrectable counter that goes down means the modem restarted: the
+    counter is taken as the new base and no rate is derived from it, and
+    the time is kept in ``last_counter_reset``.
+    """
+
+    def __init__(
+        self,
+        alpha: float,
+        warmup: int,
+        snr_drop: float,
+        error_rate: float,
+        spike_factor: float,
+    ) -> None:
+        """Initialize the detector."""
+        self.alpha = alpha
+        self.warmup = warmup
+        self.snr_drop = snr_drop
+        self.error_rate = error_rate
+        self.spike_factor = spike_factor
+        self._slots: dict[int, int] = {}
+        self._snr = array("d")
+        self._rate = array("d")
+        self._counter = array("d")
+        self._time = array("d")
+        self._samples = array("l")
+        self.last_counter_reset: float | None = None
+
+    def update(self, timestamp: float, channels: list[DownstreamChannel]) -> dict:
+        """Evaluate a poll's channels and fold them into the baselines.
+
+        Returns ``snr_drop`` and ``error_spike``, lists of the anomalous
+        channels with their value and baseline, ``counter_reset``, True if
+        the uncorrectable counters went down since the last poll, and
+        ``last_counter_reset``, when they last did (None if never).
+        """
+        alpha = self.alpha
+        snr_drops = []
+        error_spikes = []
+        counter_reset = False
+
+        for channel in channels:
+            if (slot := self._slots.get(channel.channel)) is None:
+                self._add_slot(channel, timestamp)
+                continue
+
+            baseline_snr = self._snr[slot]
+            warm = self._samples[slot] >= self.warmup
+            if warm and baseline_snr - channel.snr >= self.snr_drop:
+                snr_drops.append(
+                    {
+                        "channel": channel.channel,
+                        "snr": channel.snr,
+                        "baseline": round(baseline_snr, 1),
+                    }
+                )
+            self._snr[slot] = baseline_snr + alpha * (channel.snr - baseline_snr)
+
+            delta = channel.uncorrectable - self._counter[slot]
+            minutes = (timestamp - self._time[slot]) / 60
+            if delta < 0:
+                counter_reset = True
+                self.last_counter_reset = timestamp
+            elif minutes > 0:
+                rate = delta / minutes
+                baseline_rate = self._rate[slot]
+                if (
+                    warm
+                    and rate >= self.error_rate
+                    and rate >= self.spike_factor * baseline_rate
+                ):
+                    error_spikes.append(
+                        {
+                            "channel": channel.channel,
+                            "rate": round(rate, 1),
+                            "baseline": round(baseline_rate, 1),
+                        }
+                    )
+                self._rate[slot] = baseline_rate + alpha * (rate - baseline_rate)
+            self._counter[slot] = channel.uncorrectable
+            self._time[slot] = timestamp
+            self._samples[slot] += 1
+
+        return {
+            "snr_drop": snr_drops,
+            "error_spike": error_spikes,
+            "counter_reset": counter_reset,
+            "last_counter_reset": self.last_counter_reset,
+        }
+
+    def _add_slot(self, channel: DownstreamChannel, timestamp: float) -> None:
+        """Start the baselines of a channel seen for the first time."""
+        self._slots[channel.channel] = len(self._snr)
+        self._snr.append(channel.snr)
+        self._rate.append(0.0)
+        self._counter.append(channel.uncorrectable)
+        self._time.append(timestamp)
+        self._samples.append(1)
@@ -0,0 +1,86 @@
+"""Binary sensor platform for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity import ArrisEntity
+
+
+@dataclass
+class ArrisBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describe ARRIS binary sensor entity."""
+
+    kind: str = None
+
+
+BINARY_SENSOR_TYPES: tuple[ArrisBinarySensorEntityDescription, ...] = (
+    ArrisBinarySensorEntityDescription(
+        key="ds_snr_drop",
+        name="Downstream SNR Drop",
+        icon="mdi:signal-off",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        kind="snr_drop",
+    ),
+    ArrisBinarySensorEntityDescription(
+        key="ds_error_spike",
+        name="Downstream Error Spike",
+        icon="mdi:alert-octagram",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        kind="error_spike",
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up ARRIS binary sensors."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    model = coordinator.data.get("model", "ARRIS Modem")
+
+    async_add_entities(
+        ArrisBinarySensor(coordinator, description, entry, model)
+        for description in BINARY_SENSOR_TYPES
+    )
+
+
+class ArrisBinarySensor(ArrisEntity, BinarySensorEntity):
+    """Representation of an ARRIS channel anomaly binary sensor."""
+
+    entity_description: ArrisBinarySensorEntityDescription
+
+    def __init__(self, coordinator, description, entry, model):
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry, model)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True while any downstream channel has the anomaly."""
+        if (anomalies := self.coordinator.data.get("anomalies")) is None:
+            return None
+        return bool(anomalies[self.entity_description.kind])
+
+    @property
+    def extra_state_attributes(self):
+        """Return the numbers of the anomalous channels."""
+        if (anomalies := self.coordinator.data.get("anomalies")) is None:
+            return None
+        return {
+            "channels": [
+                entry["channel"] for entry in anomalies[self.entity_description.kind]
+            ]
+        }
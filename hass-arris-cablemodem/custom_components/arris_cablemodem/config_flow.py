@@ -1,17 +1,42 @@
 """Config flow for ARRIS Surfoard Cable Modems with auto-discovery."""
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
 from typing import Any
 
+import aiohttp
+import async_timeout
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DEFAULT_HOST, DISCOVERY_HOSTS, DOMAIN, SUPPORTED_MODELS
-from .modem import ArrisModem
+from .const import (
+    CONF_MAX_INTERVAL,
+    CONF_METRICS,
+    CONF_MIN_INTERVAL,
+    CONF_MODEL,
+    CONF_NETWORK,
+    DEFAULT_HOST,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_HOSTS,
+    DISCOVERY_PORT,
+    DISCOVERY_SCAN_CONCURRENCY,
+    DISCOVERY_SCAN_MAX_HOSTS,
+    DISCOVERY_SCAN_TIMEOUT,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+    SUPPORTED_MODELS,
+)
+from .modem import ArrisAuthError, ArrisModem
+from .parsers import get_parser, has_parser
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +49,17 @@ class ArrisSB6183ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize the config flow."""
         self._discovered_modems = []
+        self._host: str | None = None
+        self._model: str | None = None
+        self._reauth_entry: config_entries.ConfigEntry | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> ArrisOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return ArrisOptionsFlowHandler(config_entry)
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -49,6 +85,8 @@ class ArrisSB6183ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle discovery step - let user pick from discovered modems."""
         if user_input is not None:
             selected = user_input["modem"]
+            if selected == "manual":
+                return await self.async_step_manual()
             for modem_info in self._discovered_modems:
                 if modem_info["display"] == selected:
                     return await self._async_create_entry(
@@ -78,59 +116,285 @@ class ArrisSB6183ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST]
-            
-            # Test connection
-            modem = ArrisModem(host)
-            try:
-                status = await self.hass.async_add_executor_job(modem.get_status)
-                model = status.get("model", "Unknown")
-                return await self._async_create_entry(host, model)
-            except Exception as err:
-                _LOGGER.error("Cannot connect to modem at %s: %s", host, err)
-                errors["base"] = "cannot_connect"
+            if network := user_input.get(CONF_NETWORK):
+                # Scan the given range instead of testing a single host
+                try:
+                    hosts = self._network_hosts(network)
+                except ValueError:
+                    errors[CONF_NETWORK] = "invalid_network"
+                else:
+                    if hosts is None:
+                        errors[CONF_NETWORK] = "network_too_large"
+                    elif discovered := await self._async_discover_modems(
+                        hosts, DISCOVERY_SCAN_TIMEOUT
+                    ):
+                        self._discovered_modems = discovered
+                        return await self.async_step_discovery()
+                    else:
+                        errors[CONF_NETWORK] = "no_modems_found"
+            else:
+                host = user_input[CONF_HOST]
+                
+                # Test connection
+                modem = ArrisModem(host, async_get_clientsession(self.hass))
+                try:
+                    status = await modem.async_get_status()
+                    model = status.get("model", "Unknown")
+                    return await self._async_create_entry(host, model)
+                except Exception as err:
+                    _LOGGER.error("Cannot connect to modem at %s: %s", host, err)
+                    errors["base"] = "cannot_connect"
 
         return self.async_show_form(
             step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_HOST, default=DEFAULT_HOST): str,
+                    vol.Optional(CONF_NETWORK): str,
                 }
             ),
             errors=errors,
         )
 
-    async def _async_discover_modems(self) -> list[dict]:
-        """Attempt to discover ARRIS modems on the network."""
-        discovered = []
+    async def _async_discover_modems(
+        self,
+        hosts: list[str] = DISCOVERY_HOSTS,
+        deadline: float = DISCOVERY_TIMEOUT,
+    ) -> list[dict]:
+        """Attempt to discover ARRIS modems on the network.
+
+        All hosts are probed concurrently, at most DISCOVERY_SCAN_CONCURRENCY
+        at a time, and probes still running at the deadline are cancelled.
+        """
+        session = async_get_clientsession(self.hass)
+        semaphore = asyncio.Semaphore(DISCOVERY_SCAN_CONCURRENCY)
+        tasks = [
+            asyncio.create_task(self._async_probe(host, session, semaphore))
+            for host in hosts
+        ]
+        _, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
         
-        for host in DISCOVERY_HOSTS:
+        # Keep the order of the candidate list
+        return [
+            task.result()
+            for task in tasks
+            if task not in pending and task.result() is not None
+        ]
+
+    async def _async_probe(
+        self,
+        host: str,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+    ) -> dict | None:
+        """Probe one host, fetching the status page only if it answers."""
+        async with semaphore:
+            # Cheap prefilter: skip hosts with nothing listening
             try:
-                modem = ArrisModem(host)
-                status = await self.hass.async_add_executor_job(modem.get_status)
-                
-                # Check if it's a supported model
-                model = status.get("model", "")
-                if any(supported in model for supported in SUPPORTED_MODELS):
-                    discovered.append({
-                        "host": host,
-                        "model": model,
-                        "display": f"{model} at {host}",
-                    })
-                    _LOGGER.info("Discovered ARRIS modem: %s at %s", model, host)
+                async with async_timeout.timeout(DISCOVERY_CONNECT_TIMEOUT):
+                    _, writer = await asyncio.open_connection(host, DISCOVERY_PORT)
+                writer.close()
+            except (OSError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("No modem found at %s: %s", host, err)
+                return None
+            
+            try:
+                status = await ArrisModem(host, session).async_get_status()
             except Exception as err:
                 _LOGGER.debug("No modem found at %s: %s", host, err)
-                continue
+                return None
         
-        return discovered
+        # Check if it's a supported model
+        model = status.get("model", "")
+        if not any(supported in model for supported in SUPPORTED_MODELS):
+            return None
+        _LOGGER.info("Discovered ARRIS modem: %s at %s", model, host)
+        return {
+            "host": host,
+            "model": model,
+            "display": f"{model} at {host}",
+        }
 
-    async def _async_create_entry(self, host: str, model: str) -> FlowResult:
-        """Create the config entry."""
+    @staticmethod
+    def _network_hosts(network: str) -> list[str] | None:
+        """Return the hosts of a CIDR range, or None if it is too large."""
+        net = ipaddress.IPv4Network(network.strip(), strict=False)
+        if net.num_addresses > DISCOVERY_SCAN_MAX_HOSTS:
+            return None
+        if net.num_addresses == 1:
+            return [str(net.network_address)]
+        return [str(host) for host in net.hosts()]
+
+    async def _async_create_entry(
+        self, host: str, model: str, credentials: dict[str, str] | None = None
+    ) -> FlowResult:
+        """Create the config entry.
+
+        Gateways, whose full status is behind a login, first ask for the
+        credentials.
+        """
         await self.async_set_unique_id(host)
         self._abort_if_unique_id_configured()
-        
+
+        if credentials is None and _needs_login(model):
+            self._host, self._model = host, model
+            return await self.async_step_credentials()
+
+        data = {CONF_HOST: host, **(credentials or {})}
+        if has_parser(model):
+            data[CONF_MODEL] = model
+
         return self.async_create_entry(
             title=f"{model} ({host})",
-            data={CONF_HOST: host},
+            data=data,
+        )
+
+    async def async_step_credentials(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for the gateway login, which may be left empty."""
+        errors = {}
+
+        if user_input is not None:
+            if not user_input.get(CONF_USERNAME):
+                return await self._async_create_entry(self._host, self._model, {})
+            if error := await self._async_validate_login(
+                self._host, self._model, user_input
+            ):
+                errors["base"] = error
+            else:
+                return await self._async_create_entry(
+                    self._host, self._model, _credentials(user_input)
+                )
+
+        return self.async_show_form(
+            step_id="credentials",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_USERNAME): str,
+                    vol.Optional(CONF_PASSWORD): str,
+                }
+            ),
+            description_placeholders={"model": self._model, "host": self._host},
+            errors=errors,
+        )
+
+    async def async_step_reauth(self, entry_data: dict[str, Any]) -> FlowResult:
+        """Ask for new credentials after the gateway rejected the login."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
         )
+        return await self.async_step_reauth_confirm()
 
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Validate and store the new credentials."""
+        entry = self._reauth_entry
+        errors = {}
+
+        if user_input is not None:
+            if not (
+                error := await self._async_validate_login(
+                    entry.data[CONF_HOST], entry.data.get(CONF_MODEL), user_input
+                )
+            ):
+                self.hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, **_credentials(user_input)}
+                )
+                # A loaded entry is reloaded by its update listener; an entry
+                # whose setup failed on the login has no listener yet
+                if entry.state is not config_entries.ConfigEntryState.LOADED:
+                    await self.hass.config_entries.async_reload(entry.entry_id)
+                return self.async_abort(reason="reauth_successful")
+            errors["base"] = error
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_USERNAME, default=entry.data.get(CONF_USERNAME, "")
+                    ): str,
+                    vol.Required(CONF_PASSWORD): str,
+                }
+            ),
+            description_placeholders={"host": entry.data[CONF_HOST]},
+            errors=errors,
+        )
+
+    async def _async_validate_login(
+        self, host: str, model: str | None, user_input: dict[str, Any]
+    ) -> str | None:
+        """Log in and read the status once; return an error key on failure."""
+        modem = ArrisModem(
+            host,
+            async_get_clientsession(self.hass),
+            model,
+            user_input[CONF_USERNAME],
+            user_input.get(CONF_PASSWORD, ""),
+        )
+        try:
+            await modem.async_get_status()
+        except ArrisAuthError:
+            return "invalid_auth"
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error("Cannot log in to modem at %s: %s", host, err)
+            return "cannot_connect"
+        return None
+
+
+def _needs_login(model: str | None) -> bool:
+    """Return True if the model's full status is behind a login."""
+    return has_parser(model) and hasattr(get_parser(model), "login_path")
+
+
+def _credentials(user_input: dict[str, Any]) -> dict[str, str]:
+    """Return the credentials to store from a form's input."""
+    return {
+        CONF_USERNAME: user_input[CONF_USERNAME],
+        CONF_PASSWORD: user_input.get(CONF_PASSWORD, ""),
+    }
+
+
+class ArrisOptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle ARRIS modem options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling interval bounds and the metrics endpoint."""
+        errors = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_INTERVAL] > user_input[CONF_MAX_INTERVAL]:
+                errors["base"] = "invalid_interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_MAX_INTERVAL,
+                        default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_METRICS, default=options.get(CONF_METRICS, False)
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
@@ -13,3 +13,72 @@ DISCOVERY_HOSTS = [
     "192.168.0.1",    # Alternative default
     "10.0.0.1",       # Some configurations
 ]
+
+# Discovery probing
+DISCOVERY_PORT = 80
+DISCOVERY_CONNECT_TIMEOUT = 1.0  # TCP-connect prefilter per host, seconds
+DISCOVERY_TIMEOUT = 8  # Overall deadline for probing DISCOVERY_HOSTS, seconds
+DISCOVERY_SCAN_TIMEOUT = 60  # Overall deadline for a network range scan, seconds
+DISCOVERY_SCAN_CONCURRENCY = 32  # Hosts probed at once
+DISCOVERY_SCAN_MAX_HOSTS = 1024  # Largest network range accepted (a /22)
+
+CONF_NETWORK = "network"
+CONF_MODEL = "model"  # Model identified on first contact, picks its parser
+
+# Adaptive polling
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+DEFAULT_SCAN_INTERVAL = 60  # Interval the first polls run at, seconds
+DEFAULT_MIN_INTERVAL = 15  # Interval while the line is changing, seconds
+DEFAULT_MAX_INTERVAL = 300  # Longest stable or unreachable interval, seconds
+STABLE_BACKOFF_FACTOR = 1.5  # Interval growth per poll while stable
+POLL_JITTER = 0.1  # +/- fraction applied to every interval
+POWER_CHANGE_THRESHOLD = 0.5  # Average power change counted as moving, dB
+SNR_CHANGE_THRESHOLD = 0.5  # Average SNR change counted as moving, dB
+
+# Fleet poller
+DATA_POLLER = "poller"  # hass.data[DOMAIN] key of the shared ArrisFleetPoller
+FLEET_MAX_CONCURRENT_FETCHES = 4  # Status pages fetched at once across modems
+
+# Status page fetch budget, seconds
+FETCH_CONNECT_TIMEOUT = 3  # Establishing the TCP connection
+FETCH_READ_TIMEOUT = 5  # Waiting for the first byte, and for each later read
+FETCH_TOTAL_TIMEOUT = 10  # Whole request, connect through last byte
+FETCH_DRAIN_LIMIT = 65536  # Bytes left after parsing read to keep the connection, at most
+
+# Poll statistics
+STATS_WINDOW = 100  # Polls kept for the rolling percentiles
+SIGNAL_STATS_UPDATED = f"{DOMAIN}_stats_updated_{{}}"  # Formatted with entry_id
+
+# Channel history
+HISTORY_SIZE = 360  # Polls kept per channel in memory
+SERVICE_GET_CHANNEL_HISTORY = "get_channel_history"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DIRECTION = "direction"
+ATTR_FIELD = "field"
+ATTR_CHANNELS = "channels"
+ATTR_WINDOW = "window"
+ATTR_INCLUDE_VALUES = "include_values"
+
+# Last-known snapshot, restored at startup
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.{{}}"  # Formatted with entry_id
+SNAPSHOT_SAVE_DELAY = 60  # Seconds new data is held before it is written
+
+# Channel anomaly detection
+ANOMALY_EWMA_ALPHA = 0.1  # Weight of the newest poll in the channel baselines
+ANOMALY_WARMUP = 5  # Polls of a channel before it can be reported
+ANOMALY_SNR_DROP = 3.0  # SNR this far below the baseline is a drop, dB
+ANOMALY_ERROR_RATE = 10.0  # Lowest uncorrectable rate reported, per minute
+ANOMALY_SPIKE_FACTOR = 5.0  # Rate this many times the baseline is a spike
+
+# Event log
+EVENT_LOG_INTERVAL = 300  # Shortest time between event log reads, seconds
+EVENT_LOG_INDEX_SIZE = 1024  # Digests of seen entries kept to skip repeats
+EVENT_LOG_STORAGE_KEY = f"{DOMAIN}.{{}}.event_log"  # Formatted with entry_id
+EVENT_MODEM_LOG = f"{DOMAIN}_event_log"  # Fired once per new log entry
+
+# OpenMetrics endpoint
+CONF_METRICS = "metrics"  # Option serving the modem's data as Prometheus metrics
+DATA_METRICS_VIEW = "metrics_view"  # hass.data[DOMAIN] key of the registered view
+METRICS_URL = f"/api/{DOMAIN}/metrics"
@@ -0,0 +1,427 @@
+"""Data update coordinator for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .anomaly import ChannelAnomalyDetector
+from .const import (
+    ANOMALY_ERROR_RATE,
+    ANOMALY_EWMA_ALPHA,
+    ANOMALY_SNR_DROP,
+    ANOMALY_SPIKE_FACTOR,
+    ANOMALY_WARMUP,
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EVENT_LOG_INDEX_SIZE,
+    EVENT_LOG_INTERVAL,
+    EVENT_LOG_STORAGE_KEY,
+    EVENT_MODEM_LOG,
+    HISTORY_SIZE,
+    POLL_JITTER,
+    POWER_CHANGE_THRESHOLD,
+    SIGNAL_STATS_UPDATED,
+    SNAPSHOT_SAVE_DELAY,
+    SNR_CHANGE_THRESHOLD,
+    STABLE_BACKOFF_FACTOR,
+    STATS_WINDOW,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .eventlog import EventLogIndex
+from .history import ChannelHistory
+from .modem import ArrisAuthError, ArrisModem
+from .models import ChannelRecord, DownstreamChannel, UpstreamChannel
+from .stats import PollStats
+
+if TYPE_CHECKING:
+    from .poller import ArrisFleetPoller
+
+_LOGGER = logging.getLogger(__name__)
+
+# Per-direction channel fields summarized as average/min/max/spread, and
+# counters summarized as totals
+SUMMARY_FIELDS = {"downstream": ("power", "snr"), "upstream": ("power",)}
+SUMMARY_COUNTERS = {"downstream": ("corrected", "uncorrectable"), "upstream": ()}
+
+
+class ArrisDataUpdateCoordinator(DataUpdateCoordinator[dict]):
+    """Hold the data of one ARRIS modem.
+
+    Polls are scheduled and fetched by the shared ArrisFleetPoller, which
+    reads ``poll_interval`` after every refresh. The interval adapts: it
+    drops to the minimum while the signal is moving or the modem is
+    rebooting, grows with jitter towards the maximum while the signal is
+    stable, and backs off exponentially while the modem is unreachable.
+
+    Every poll is timed per phase into ``stats``; diagnostic sensors are
+    told through SIGNAL_STATS_UPDATED, since unchanged data does not notify
+    the regular listeners.
+
+    The channel values of every successful poll are also kept in
+    ``history``, a fixed-size in-memory ring buffer queried by the
+    get_channel_history service.
+
+    On every successful poll, ``anomalies`` compares every downstream
+    channel with its own baseline, and the result is added to the data as
+    ``anomalies`` for the problem sensors. An unchanged page keeps the data
+    object unless the result differs.
+
+    The last parsed status is saved with the storage helper, so entities
+    can be created from it at the next startup before the modem answers.
+
+    Every EVENT_LOG_INTERVAL the modem's event log is read as well, in a
+    background task of the config entry so the status refresh does not wait
+    for it, and each entry not seen before is fired as an EVENT_MODEM_LOG
+    event. The digests of the seen entries are saved too, so a restart does
+    not fire the whole log again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        poller: ArrisFleetPoller,
+        modem: ArrisModem,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.min_interval = entry.options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        self.max_interval = max(
+            entry.options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+            self.min_interval,
+        )
+        self._interval = min(
+            max(DEFAULT_SCAN_INTERVAL, self.min_interval), self.max_interval
+        )
+        self.poll_interval: float = self._interval
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="arris_sb6183",
+            # Scheduling is done by the fleet poller
+            update_interval=None,
+            # The modem returns the same status object while the page is
+            # unchanged; skip notifying entities in that case
+            always_update=False,
+        )
+        self.poller = poller
+        self.modem = modem
+        self.stats = PollStats(STATS_WINDOW)
+        self.stats_signal = SIGNAL_STATS_UPDATED.format(entry.entry_id)
+        self.history = ChannelHistory(HISTORY_SIZE)
+        self.anomalies = ChannelAnomalyDetector(
+            ANOMALY_EWMA_ALPHA,
+            ANOMALY_WARMUP,
+            ANOMALY_SNR_DROP,
+            ANOMALY_ERROR_RATE,
+            ANOMALY_SPIKE_FACTOR,
+        )
+        self._store: Store[dict] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry.entry_id)
+        )
+        self._status: dict | None = None
+        self._entry = entry
+        self._event_index: EventLogIndex | None = None
+        self._event_log_due = 0.0
+        self._event_log_task: asyncio.Task | None = None
+        self._event_log_failing = False
+        self._event_store: Store[dict] = Store(
+            hass, STORAGE_VERSION, EVENT_LOG_STORAGE_KEY.format(entry.entry_id)
+        )
+        self._failures = 0
+
+    async def async_restore(self) -> bool:
+        """Use the last saved status as data, if there is one."""
+        if not (stored := await self._store.async_load()):
+            return False
+        try:
+            status = {
+                **stored,
+                "downstream": [
+                    DownstreamChannel(**ch) for ch in stored["downstream"]
+                ],
+                "upstream": [UpstreamChannel(**ch) for ch in stored["upstream"]],
+            }
+        except (KeyError, TypeError) as err:
+            _LOGGER.warning("Ignoring saved status of %s: %s", self.modem.host, err)
+            return False
+        self.data = build_snapshot(status)
+        return True
+
+    async def async_shutdown(self) -> None:
+        """Stop refreshing and write the delayed saves now.
+
+        A delayed save left pending would otherwise write its file up to
+        SNAPSHOT_SAVE_DELAY later, after the config entry may have been
+        removed along with its files.
+        """
+        await super().async_shutdown()
+        if self._event_log_task is not None:
+            self._event_log_task.cancel()
+        if self._status is not None:
+            await self._store.async_save(self._status_to_store())
+        if self._event_index is not None:
+            await self._event_store.async_save(self._event_index_to_store())
+
+    async def async_refresh(self) -> None:
+        """Refresh data and tell the diagnostic sensors about the poll."""
+        await super().async_refresh()
+        async_dispatcher_send(self.hass, self.stats_signal)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, timing the entity state writes."""
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self.stats.record_update(time.perf_counter() - started)
+
+    async def _async_update_data(self) -> dict:
+        """Fetch data from modem."""
+        started = time.perf_counter()
+        try:
+            status = await self.poller.async_fetch(self.modem)
+        except Exception as err:
+            self.stats.record_failure(err)
+            self._failures += 1
+            self._schedule_next(
+                self.min_interval * 2 ** min(self._failures, 16)
+            )
+            if isinstance(err, ArrisAuthError):
+                raise ConfigEntryAuthFailed(str(err)) from err
+            raise UpdateFailed(f"Error communicating with modem: {err}") from err
+
+        self.stats.record_poll(
+            time.perf_counter() - started,
+            self.modem.last_fetch_time,
+            self.modem.last_parse_time,
+            self.modem.last_response_size,
+        )
+        self._failures = 0
+        timestamp = dt_util.utcnow().timestamp()
+        self.history.record(timestamp, status)
+        self._async_schedule_event_log()
+        # Unchanged polls count too: counters that stopped climbing end a spike
+        anomalies = self.anomalies.update(timestamp, status["downstream"])
+        if status is self._status and self.data is not None:
+            self._schedule_next(self._interval * STABLE_BACKOFF_FACTOR)
+            if anomalies != self.data.get("anomalies"):
+                return {**self.data, "anomalies": anomalies}
+            return self.data
+        self._status = status
+        data = build_snapshot(status)
+        data["anomalies"] = anomalies
+        self._store.async_delay_save(self._status_to_store, SNAPSHOT_SAVE_DELAY)
+
+        if self.data is None or _signal_moving(self.data, data):
+            self._schedule_next(self.min_interval)
+        else:
+            self._schedule_next(self._interval * STABLE_BACKOFF_FACTOR)
+        return data
+
+    @callback
+    def _async_schedule_event_log(self) -> None:
+        """Start reading the event log when it is due.
+
+        The task is cancelled when the config entry is unloaded.
+        """
+        now = time.monotonic()
+        if now < self._event_log_due:
+            return
+        self._event_log_due = now + EVENT_LOG_INTERVAL
+        self._event_log_task = self._entry.async_create_background_task(
+            self.hass,
+            self._async_update_event_log(),
+            f"{DOMAIN} event log {self.modem.host}",
+        )
+
+    async def _async_update_event_log(self) -> None:
+        """Read the event log and fire an event per new entry.
+
+        The first time a modem's log is read there is nothing to compare
+        against: its entries are only recorded as seen.
+        """
+        try:
+            entries = await self.poller.async_fetch_event_log(self.modem)
+        except Exception as err:  # noqa: BLE001
+            # Warn once; a modem that does not serve the page fails every time
+            if self._event_log_failing:
+                _LOGGER.debug("Error reading event log of %s: %s", self.modem.host, err)
+            else:
+                _LOGGER.warning(
+                    "Error reading event log of %s, no log events will be fired"
+                    " until it can be read: %s",
+                    self.modem.host,
+                    err,
+                )
+                self._event_log_failing = True
+            return
+        if self._event_log_failing:
+            _LOGGER.info("Reading event log of %s again", self.modem.host)
+            self._event_log_failing = False
+        if not entries:
+            return
+
+        if self._event_index is None:
+            stored = await self._event_store.async_load()
+            self._event_index = EventLogIndex(
+                EVENT_LOG_INDEX_SIZE, stored["seen"] if stored else ()
+            )
+            if not stored:
+                self._event_index.add_new(entries)
+                self._event_store.async_delay_save(
+                    self._event_index_to_store, SNAPSHOT_SAVE_DELAY
+                )
+                return
+
+        if not (new := self._event_index.add_new(entries)):
+            return
+        for entry in new:
+            self.hass.bus.async_fire(
+                EVENT_MODEM_LOG,
+                {
+                    ATTR_CONFIG_ENTRY_ID: self._entry.entry_id,
+                    "host": self.modem.host,
+                    **entry.as_dict(),
+                },
+            )
+        self._event_store.async_delay_save(
+            self._event_index_to_store, SNAPSHOT_SAVE_DELAY
+        )
+
+    def _event_index_to_store(self) -> dict:
+        """Return the digests of the seen event log entries."""
+        return {"seen": self._event_index.as_list()}
+
+    def _status_to_store(self) -> dict:
+        """Return the last parsed status in a JSON-serializable form."""
+        return {
+            **self._status,
+            "downstream": [ch.as_dict() for ch in self._status["downstream"]],
+            "upstream": [ch.as_dict() for ch in self._status["upstream"]],
+        }
+
+    def _schedule_next(self, interval: float) -> None:
+        """Clamp the next poll interval to the bounds and add jitter."""
+        self._interval = min(max(interval, self.min_interval), self.max_interval)
+        jittered = self._interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+        self.poll_interval = min(max(jittered, self.min_interval), self.max_interval)
+
+
+def _signal_moving(previous: dict, current: dict) -> bool:
+    """Return True if the line changed enough to warrant polling faster.
+
+    Corrected errors climb steadily on healthy lines, so only uncorrectable
+    errors count as moving counters.
+    """
+    startup = current.get("startup", {})
+    if any(
+        startup.get(key) not in (None, "OK") for key in ("connectivity", "boot")
+    ):
+        return True
+
+    for direction in ("downstream", "upstream"):
+        old = previous["summary"][direction]
+        new = current["summary"][direction]
+        if old["count"] != new["count"]:
+            return True
+        if _moved(old["avg_power"], new["avg_power"], POWER_CHANGE_THRESHOLD):
+            return True
+
+    old = previous["summary"]["downstream"]
+    new = current["summary"]["downstream"]
+    return (
+        _moved(old["avg_snr"], new["avg_snr"], SNR_CHANGE_THRESHOLD)
+        or new["total_uncorrectable"] > old["total_uncorrectable"]
+    )
+
+
+def _moved(old: float | None, new: float | None, threshold: float) -> bool:
+    """Return True if a value moved by at least ``threshold``."""
+    if old is None or new is None:
+        return old is not new
+    return abs(new - old) >= threshold
+
+
+def build_snapshot(status: dict) -> dict:
+    """Build the coordinator data from a parsed modem status.
+
+    Adds ``channel_index``, mapping each direction's channel number to its
+    channel, so channel sensors do not have to scan the channel lists, and
+    ``summary``, holding the per-direction aggregates the summary sensors
+    read.
+    """
+    return {
+        **status,
+        "channel_index": {
+            direction: {ch.channel: ch for ch in status.get(direction, [])}
+            for direction in ("downstream", "upstream")
+        },
+        "summary": {
+            direction: summarize_channels(
+                status.get(direction, []),
+                SUMMARY_FIELDS[direction],
+                SUMMARY_COUNTERS[direction],
+            )
+            for direction in ("downstream", "upstream")
+        },
+    }
+
+
+def summarize_channels(
+    channels: list[ChannelRecord],
+    fields: tuple[str, ...],
+    counters: tuple[str, ...],
+) -> dict:
+    """Aggregate a channel list in a single pass.
+
+    Produces ``count``, ``avg_<field>``, ``min_<field>``, ``max_<field>``
+    and ``<field>_spread`` for each field (None without channels) and
+    ``total_<counter>`` for each counter.
+    """
+    sums = dict.fromkeys(fields, 0.0)
+    lows: dict[str, float] = {}
+    highs: dict[str, float] = {}
+    totals = dict.fromkeys(counters, 0)
+
+    for channel in channels:
+        for field in fields:
+            value = getattr(channel, field)
+            sums[field] += value
+            if field not in lows or value < lows[field]:
+                lows[field] = value
+            if field not in highs or value > highs[field]:
+                highs[field] = value
+        for counter in counters:
+            totals[counter] += getattr(channel, counter)
+
+    summary: dict = {"count": len(channels)}
+    for field in fields:
+        if channels:
+            summary[f"avg_{field}"] = round(sums[field] / len(channels), 1)
+            summary[f"min_{field}"] = lows[field]
+            summary[f"max_{field}"] = highs[field]
+            summary[f"{field}_spread"] = round(highs[field] - lows[field], 1)
+        else:
+            summary[f"avg_{field}"] = None
+            summary[f"min_{field}"] = None
+            summary[f"max_{field}"] = None
+            summary[f"{field}_spread"] = None
+    for counter in counters:
+        summary[f"total_{counter}"] = totals[counter]
+    return summary
@@ -0,0 +1,38 @@
+"""Diagnostics support for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import ArrisDataUpdateCoordinator
+
+TO_REDACT = {CONF_HOST, CONF_PASSWORD, CONF_USERNAME, "serial_number"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ArrisDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "model": data.get("model"),
+        "startup": data.get("startup"),
+        "product": async_redact_data(data.get("product") or {}, TO_REDACT),
+        "summary": data.get("summary"),
+        "anomalies": data.get("anomalies"),
+        "polling": {
+            "last_update_success": coordinator.last_update_success,
+            "poll_interval": round(coordinator.poll_interval, 1),
+            "min_interval": coordinator.min_interval,
+            "max_interval": coordinator.max_interval,
+        },
+        "stats": coordinator.stats.as_dict(),
+    }
@@ -0,0 +1,53 @@
+"""Base entity for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import ArrisDataUpdateCoordinator
+
+
+class ArrisEntity(CoordinatorEntity[ArrisDataUpdateCoordinator]):
+    """Coordinator entity that only writes its state when it changes.
+
+    Most channel values are identical between polls; skipping those writes
+    keeps redundant rows out of the state machine and the recorder.
+    """
+
+    def __init__(
+        self, coordinator: ArrisDataUpdateCoordinator, entry: ConfigEntry, model: str
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        product = (coordinator.data or {}).get("product") or {}
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": model,
+            "manufacturer": "ARRIS",
+            "model": model,
+            "sw_version": product.get("software_version"),
+            "hw_version": product.get("hardware_version"),
+        }
+        self._written_state: tuple | None = None
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return everything that ends up in the written state."""
+        return (self.available, self.state, self.extra_state_attributes)
+
+    async def async_added_to_hass(self) -> None:
+        """Record the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written_state = self._state_signature()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the value or availability changed."""
+        signature = self._state_signature()
+        if signature == self._written_state:
+            return
+        self._written_state = signature
+        super()._handle_coordinator_update()
@@ -0,0 +1,63 @@
+"""Event log deduplication for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+import hashlib
+from collections import Counter, deque
+from collections.abc import Iterable
+
+from .models import EventLogEntry
+
+
+class EventLogIndex:
+    """Bounded index of the event log entries already seen.
+
+    Each entry is remembered as a 64-bit digest of its fields and of how
+    many identical entries precede it in the log, so repeated lines (a
+    burst of T3 timeouts before the clock is set) count separately. Once
+    ``size`` digests are held the oldest is forgotten, keeping memory
+    constant however long the modem runs.
+    """
+
+    def __init__(self, size: int, seen: Iterable[int] = ()) -> None:
+        """Initialize the index, optionally with digests saved earlier."""
+        self._order: deque[int] = deque(maxlen=size)
+        self._seen: set[int] = set()
+        for key in seen:
+            self._add(key)
+
+    def __len__(self) -> int:
+        """Return the number of digests held."""
+        return len(self._seen)
+
+    def add_new(self, entries: list[EventLogEntry]) -> list[EventLogEntry]:
+        """Add the entries not seen before and return them, in log order."""
+        occurrences: Counter[EventLogEntry] = Counter()
+        new = []
+        for entry in entries:
+            occurrences[entry] += 1
+            key = _digest(entry, occurrences[entry])
+            if key not in self._seen:
+                self._add(key)
+                new.append(entry)
+        return new
+
+    def as_list(self) -> list[int]:
+        """Return the digests, oldest first, to be saved."""
+        return list(self._order)
+
+    def _add(self, key: int) -> None:
+        """Remember a digest, forgetting the oldest if the index is full."""
+        if len(self._order) == self._order.maxlen:
+            self._seen.discard(self._order[0])
+        self._order.append(key)
+        self._seen.add(key)
+
+
+def _digest(entry: EventLogEntry, occurrence: int) -> int:
+    """Return the 64-bit digest of an entry and its occurrence number."""
+    data = "\x1f".join(
+        (entry.time, entry.priority, entry.description, str(occurrence))
+    )
+    return int.from_bytes(
+        hashlib.blake2b(data.encode(), digest_size=8).digest(), "big"
+    )
@@ -0,0 +1,116 @@
+"""In-memory per-channel signal history for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+
+# Channel fields kept per direction
+HISTORY_FIELDS = {
+    "downstream": ("power", "snr", "corrected", "uncorrectable"),
+    "upstream": ("power",),
+}
+
+
+class ChannelHistory:
+    """Fixed-size ring buffers of recent channel values.
+
+    Every recorded poll takes one slot in a shared ring of timestamps and,
+    at the same index, one slot in a ``array('d')`` per channel and field.
+    A channel missing from a poll gets NaN in that slot. Once the ring is
+    full the oldest poll is overwritten, so memory stays constant.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the history."""
+        self.size = size
+        self._times = array("d", [math.nan]) * size
+        self._series: dict[tuple[str, str, int], array] = {}
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of polls held."""
+        return self._count
+
+    def record(self, timestamp: float, data: dict) -> None:
+        """Record the channel values of a poll."""
+        slot = self._next
+        self._times[slot] = timestamp
+        seen = set()
+
+        for direction, fields in HISTORY_FIELDS.items():
+            for channel in data.get(direction, []):
+                for field in fields:
+                    key = (direction, field, channel.channel)
+                    if (series := self._series.get(key)) is None:
+                        series = self._series[key] = array("d", [math.nan]) * self.size
+                    series[slot] = getattr(channel, field)
+                    seen.add(key)
+
+        for key, series in self._series.items():
+            if key not in seen:
+                series[slot] = math.nan
+
+        self._next = (slot + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def channels(self, direction: str, field: str) -> list[int]:
+        """Return the channel numbers with history for a field."""
+        return sorted(
+            channel
+            for series_direction, series_field, channel in self._series
+            if (series_direction, series_field) == (direction, field)
+        )
+
+    def query(
+        self,
+        direction: str,
+        field: str,
+        channels: list[int] | None = None,
+        since: float | None = None,
+        include_values: bool = False,
+    ) -> dict[int, dict]:
+        """Summarize the history of a field per channel.
+
+        Only polls at or after ``since`` are included. Each channel gets
+        ``samples``, ``min``, ``max``, ``mean``, ``first``, ``last`` and
+        ``delta`` (last minus first), all None without samples, plus the
+        ``timestamps`` and ``values`` themselves when ``include_values`` is
+        set.
+        """
+        times = self._ordered(self._times)
+        start = 0 if since is None else bisect_left(times, since)
+        times = times[start:]
+
+        result = {}
+        for channel in channels or self.channels(direction, field):
+            if (series := self._series.get((direction, field, channel))) is None:
+                continue
+            window = self._ordered(series)[start:]
+            points = [
+                (time, value)
+                for time, value in zip(times, window)
+                if not math.isnan(value)
+            ]
+            values = [value for _, value in points]
+            summary = {
+                "samples": len(values),
+                "min": min(values, default=None),
+                "max": max(values, default=None),
+                "mean": round(math.fsum(values) / len(values), 2) if values else None,
+                "first": values[0] if values else None,
+                "last": values[-1] if values else None,
+                "delta": round(values[-1] - values[0], 2) if values else None,
+            }
+            if include_values:
+                summary["timestamps"] = [time for time, _ in points]
+                summary["values"] = values
+            result[channel] = summary
+        return result
+
+    def _ordered(self, ring: array) -> array:
+        """Return the recorded slots of a ring, oldest first."""
+        if self._count < self.size:
+            return ring[: self._count]
+        return ring[self._next :] + ring[: self._next]
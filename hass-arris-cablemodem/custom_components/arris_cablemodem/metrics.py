@@ -0,0 +1,183 @@
+"""OpenMetrics (Prometheus) endpoint for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_METRICS, DATA_METRICS_VIEW, DOMAIN, METRICS_URL
+from .coordinator import ArrisDataUpdateCoordinator
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Per-channel metric families: (name, type, help, direction, field)
+CHANNEL_METRICS = (
+    ("arris_downstream_power_dbmv", "gauge", "Downstream channel power.", "downstream", "power"),
+    ("arris_downstream_snr_db", "gauge", "Downstream channel signal to noise ratio.", "downstream", "snr"),
+    ("arris_downstream_corrected_codewords", "counter", "Codewords corrected on a downstream channel.", "downstream", "corrected"),
+    ("arris_downstream_uncorrectable_codewords", "counter", "Codewords lost on a downstream channel.", "downstream", "uncorrectable"),
+    ("arris_upstream_power_dbmv", "gauge", "Upstream channel power.", "upstream", "power"),
+)
+
+# Every family in output order: (name, type, help)
+FAMILIES = (
+    ("arris_up", "gauge", "Whether the last poll of the modem succeeded."),
+    *((name, kind, help_text) for name, kind, help_text, _, _ in CHANNEL_METRICS),
+    ("arris_startup", "info", "Status of each step of the modem's startup procedure."),
+)
+
+# Suffix of a family's sample names, by type
+SAMPLE_SUFFIXES = {"gauge": "", "counter": "_total", "info": "_info"}
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view, once for all config entries.
+
+    Views cannot be unregistered, so the view stays after the option is
+    turned off and then serves only the entries that still have it set.
+    """
+    if DATA_METRICS_VIEW not in hass.data[DOMAIN]:
+        view = hass.data[DOMAIN][DATA_METRICS_VIEW] = ArrisMetricsView(hass)
+        hass.http.register_view(view)
+
+
+class ArrisMetricsView(HomeAssistantView):
+    """Serve the latest data of every modem as OpenMetrics text.
+
+    Each modem's samples are rendered once per refresh: the coordinator
+    keeps the same data object while nothing changed, so the cache is keyed
+    on that object and on whether the last poll succeeded. The full response
+    is cached on the same keys, so scrapes between refreshes cost no
+    rendering at all.
+    """
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+        self._samples: dict[str, tuple[tuple, dict[str, list[str]]]] = {}
+        self._body: tuple[list[tuple], bytes] | None = None
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics of the modems that have the option set."""
+        coordinators = [
+            coordinator
+            for coordinator in self.hass.data.get(DOMAIN, {}).values()
+            if isinstance(coordinator, ArrisDataUpdateCoordinator)
+            and coordinator.config_entry.options.get(CONF_METRICS)
+        ]
+        if not coordinators:
+            raise web.HTTPNotFound()
+
+        keys = [_cache_key(coordinator) for coordinator in coordinators]
+        if (
+            self._body is None
+            or len(self._body[0]) != len(keys)
+            or not all(map(_same_key, self._body[0], keys))
+        ):
+            self._body = (keys, self._render(coordinators))
+
+        return web.Response(
+            body=self._body[1], headers={"Content-Type": CONTENT_TYPE}
+        )
+
+    def _render(self, coordinators: list[ArrisDataUpdateCoordinator]) -> bytes:
+        """Render the response, reusing the samples of unchanged modems."""
+        samples = {}
+        for coordinator in coordinators:
+            entry_id = coordinator.config_entry.entry_id
+            key = _cache_key(coordinator)
+            cached = self._samples.get(entry_id)
+            if cached is None or not _same_key(cached[0], key):
+                cached = self._samples[entry_id] = (key, render_modem(coordinator))
+            samples[entry_id] = cached[1]
+
+        # Drop modems that were unloaded or had the option turned off
+        for entry_id in self._samples.keys() - samples.keys():
+            del self._samples[entry_id]
+
+        lines = []
+        for name, kind, help_text in FAMILIES:
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"# HELP {name} {help_text}")
+            for modem_samples in samples.values():
+                lines.extend(modem_samples.get(name, ()))
+        lines.append("# EOF\n")
+        return "\n".join(lines).encode()
+
+
+def render_modem(coordinator: ArrisDataUpdateCoordinator) -> dict[str, list[str]]:
+    """Render the sample lines of one modem, by metric family.
+
+    Channel and startup samples are left out while the modem is
+    unreachable, so stale values are not reported as current.
+    """
+    host = coordinator.modem.host
+    data = coordinator.data or {}
+    up = coordinator.last_update_success
+    samples = {
+        "arris_up": [
+            _sample("arris_up", {"host": host, "model": data.get("model")}, int(up))
+        ]
+    }
+    if not up:
+        return samples
+
+    for name, kind, _, direction, field in CHANNEL_METRICS:
+        sample_name = name + SAMPLE_SUFFIXES[kind]
+        samples[name] = [
+            _sample(
+                sample_name,
+                {
+                    "host": host,
+                    "channel": channel.channel,
+                    "channel_id": channel.channel_id,
+                    "frequency": channel.frequency,
+                },
+                getattr(channel, field),
+            )
+            for channel in data.get(direction, [])
+        ]
+
+    samples["arris_startup"] = [
+        _sample("arris_startup_info", {"host": host, "step": step, "status": status}, 1)
+        for step, status in (data.get("startup") or {}).items()
+    ]
+    return samples
+
+
+def _cache_key(coordinator: ArrisDataUpdateCoordinator) -> tuple:
+    """Return what a modem's rendered samples depend on."""
+    return (
+        coordinator.config_entry.entry_id,
+        coordinator.data,
+        coordinator.last_update_success,
+    )
+
+
+def _same_key(cached: tuple, current: tuple) -> bool:
+    """Compare cache keys, the data objects by identity."""
+    return (
+        cached[0] == current[0]
+        and cached[1] is current[1]
+        and cached[2] == current[2]
+    )
+
+
+def _sample(name: str, labels: dict, value: float) -> str:
+    """Format one sample line."""
+    label_text = ",".join(
+        f'{label}="{_escape(label_value)}"'
+        for label, label_value in labels.items()
+        if label_value is not None
+    )
+    return f"{name}{{{label_text}}} {value}"
+
+
+def _escape(value) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
@@ -0,0 +1,72 @@
+"""Records read from ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Any
+
+
+class ChannelRecord:
+    """Dict-style access to an immutable channel record.
+
+    Kept so consumers written against the old per-channel dicts
+    (``channel["power"]``, ``channel.get("snr")``) keep working.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field by name."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or ``default`` if there is no such field."""
+        return getattr(self, key, default)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dict."""
+        return dataclasses.asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class DownstreamChannel(ChannelRecord):
+    """A downstream bonded channel."""
+
+    channel: int
+    lock_status: str
+    modulation: str
+    channel_id: int
+    frequency: int
+    power: float
+    snr: float
+    corrected: int
+    uncorrectable: int
+
+
+@dataclass(frozen=True, slots=True)
+class UpstreamChannel(ChannelRecord):
+    """An upstream bonded channel."""
+
+    channel: int
+    lock_status: str
+    channel_type: str
+    channel_id: int
+    symbol_rate: str
+    frequency: int
+    power: float
+
+
+@dataclass(frozen=True, slots=True)
+class EventLogEntry:
+    """An entry of the modem's event log."""
+
+    time: str
+    priority: str
+    description: str
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the entry as a plain dict."""
+        return dataclasses.asdict(self)
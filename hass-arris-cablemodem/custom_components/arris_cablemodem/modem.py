@@ -1,177 +1,393 @@
 """ARRIS Surfboard Cable Modem communication."""
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
 import logging
-import re
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from html.parser import HTMLParser
+from types import ModuleType
+from typing import Any
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+
+from .const import (
+    FETCH_CONNECT_TIMEOUT,
+    FETCH_DRAIN_LIMIT,
+    FETCH_READ_TIMEOUT,
+    FETCH_TOTAL_TIMEOUT,
+)
+from .models import EventLogEntry
+from .parsers import get_parser, has_parser
 
 _LOGGER = logging.getLogger(__name__)
 
+FETCH_TIMEOUT = aiohttp.ClientTimeout(
+    total=FETCH_TOTAL_TIMEOUT,
+    sock_connect=FETCH_CONNECT_TIMEOUT,
+    sock_read=FETCH_READ_TIMEOUT,
+)
+
+
+class ArrisAuthError(Exception):
+    """The modem rejected the login."""
+
+
+class _SessionExpired(Exception):
+    """The modem no longer accepts the session cookie."""
+
 
 class ArrisModem:
     """Represent an ARRIS SB6183 modem."""
 
-    def __init__(self, host: str) -> None:
-        """Initialize the modem."""
+    def __init__(
+        self,
+        host: str,
+        session: aiohttp.ClientSession | None = None,
+        model: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+    ) -> None:
+        """Initialize the modem.
+
+        ``model`` is the model identified on an earlier run, if any; pages
+        are then handed straight to that model's parser. With ``username``,
+        models whose parser reads pages behind a login are logged in to.
+        """
         self.host = host
         self.url = f"http://{host}"
+        self.session = session
+        self.model = model
+        self.username = username
+        self.password = password
+        # Cookie header of the logged-in session, reused until the modem
+        # rejects it or it reaches its max-age (loop time)
+        self._cookie: str | None = None
+        self._cookie_expires: float | None = None
+        # Digest of the last parsed status, so an unchanged status is
+        # returned as the cached object
+        self._status_digest: bytes | None = None
+        self._status: dict | None = None
+        self._event_log_digest: bytes | None = None
+        # Timings and size of the last request, in seconds and bytes
+        self.last_fetch_time: float | None = None
+        self.last_parse_time: float | None = None
+        self.last_response_size: int | None = None
+        # The request in flight and how many callers are waiting on it
+        self._fetch: asyncio.Task | None = None
+        self._fetch_waiters = 0
+        # Reads of the unparsed rest of bodies, so their connections can be
+        # reused; cancelled by async_close
+        self._drains: set[asyncio.Task] = set()
+
+    def async_close(self) -> None:
+        """Cancel the requests still running in the background."""
+        for drain in self._drains:
+            drain.cancel()
+
+    async def async_get_status(self) -> dict:
+        """Get modem status over the shared keep-alive session.
 
-    def get_status(self) -> dict:
-        """Get modem status."""
+        Only one request is in flight per modem: callers arriving while it
+        runs wait for the same result. Cancelling a caller leaves the
+        request to the others, and the last caller to give up cancels it.
+        """
+        if self.session is None:
+            raise RuntimeError("async_get_status requires an aiohttp session")
+        if self._fetch is None:
+            self._fetch = asyncio.create_task(self._async_fetch_status())
+            self._fetch.add_done_callback(self._async_fetch_done)
+
+        fetch = self._fetch
+        self._fetch_waiters += 1
         try:
-            response = requests.get(self.url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Detect model
-            model = self._detect_model(soup)
-            
-            data = {
-                "model": model,
-                "startup": self._parse_startup(soup),
-                "downstream": self._parse_downstream(soup),
-                "upstream": self._parse_upstream(soup),
-            }
-            
-            return data
+            return await asyncio.shield(fetch)
+        except asyncio.CancelledError:
+            if self._fetch_waiters == 1:
+                fetch.cancel()
+            raise
+        finally:
+            self._fetch_waiters -= 1
+
+    def _async_fetch_done(self, fetch: asyncio.Task) -> None:
+        """Clear the finished request so the next caller starts a new one."""
+        if self._fetch is fetch:
+            self._fetch = None
+        if not fetch.cancelled():
+            # Retrieve the error so it is not reported when nobody waited
+            fetch.exception()
+
+    async def _async_fetch_status(self) -> dict:
+        """Fetch and parse the status page.
+
+        The page is parsed while it downloads, and reading stops as soon as
+        the parser has everything the status is built from.
+        """
+        try:
+            started = time.perf_counter()
+            parser = get_parser(self.model)
+            if self.username and hasattr(parser, "login_path"):
+                return await self._async_collect_status(parser, started)
+            async with self._async_request(self.url) as response:
+                response.raise_for_status()
+                return await self._async_read_status(response, started)
         except Exception as err:
             _LOGGER.error("Error fetching modem status: %s", err)
             raise
 
-    def _detect_model(self, soup: BeautifulSoup) -> str:
-        """Detect the modem model from the page."""
+    async def async_get_event_log(self) -> list[EventLogEntry] | None:
+        """Fetch the event log, oldest entry first.
+
+        Returns None if the page is the same as last time, or if the model's
+        parser does not read event logs.
+        """
+        if self.session is None:
+            raise RuntimeError("async_get_event_log requires an aiohttp session")
+        # The generic parser serves models without a parser of their own,
+        # so fall back to the model detected from the status page
+        model = self.model or (self._status or {}).get("model")
+        parser = get_parser(model)
+        if not hasattr(parser, "parse_event_log"):
+            return None
+        async with self.session.get(
+            self.url + parser.event_log_path(model), timeout=FETCH_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            body = await response.read()
+            encoding = response.get_encoding()
+
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest == self._event_log_digest:
+            return None
+        entries = parser.parse_event_log(body.decode(encoding, errors="replace"))
+        self._event_log_digest = digest
+        return entries
+
+    async def _async_read_status(
+        self, response: aiohttp.ClientResponse, started: float
+    ) -> dict:
+        """Read the status page as it downloads."""
+        page = get_parser(self.model).create_page(self.model)
+        text, size, parse_time = await self._async_feed(response, page)
+
+        self.last_response_size = size
+        parse_started = time.perf_counter()
+        status = self._cache_status(self._resolve_status(page.status(), "".join(text)))
+        parse_time += time.perf_counter() - parse_started
+        self.last_parse_time = parse_time
+        self.last_fetch_time = time.perf_counter() - started - parse_time
+        return status
+
+    async def _async_collect_status(self, parser: ModuleType, started: float) -> dict:
+        """Log in if needed and read the status from the pages behind it.
+
+        The session cookie is reused across polls. If the modem has dropped
+        the session, it logs in once more and reads the pages again.
+        """
+        loop = asyncio.get_running_loop()
+        if self._cookie_expires is not None and loop.time() >= self._cookie_expires:
+            self._cookie = None
+        if self._cookie is None:
+            await self._async_login(parser)
         try:
-            # Look for model number in binnacle
-            binnacle = soup.find("span", id="thisModelNumberIs")
-            if binnacle:
-                return binnacle.get_text(strip=True)
-            
-            # Look in page title
-            title = soup.find("title")
-            if title:
-                title_text = title.get_text()
-                # Try to extract model from title
-                for model in ["SB6183", "SB6190", "TG1682G", "TG3482G"]:
-                    if model in title_text:
-                        return model
-            
-            # Look in page content
-            text = soup.get_text()
-            match = re.search(r'(SB\d{4}|TG\d{4}[A-Z]?)', text)
-            if match:
-                return match.group(1)
-            
-            return "ARRIS Unknown"
-        except Exception as err:
-            _LOGGER.debug("Could not detect model: %s", err)
-            return "ARRIS Unknown"
+            pages = await self._async_read_pages(parser)
+        except _SessionExpired:
+            _LOGGER.debug("Session with %s expired, logging in again", self.host)
+            await self._async_login(parser)
+            pages = await self._async_read_pages(parser)
 
-    def _parse_startup(self, soup: BeautifulSoup) -> dict:
-        """Parse startup procedure table."""
-        startup = {}
+        self.last_response_size = sum(size for _, size, _ in pages)
+        parse_time = sum(page_parse_time for _, _, page_parse_time in pages)
+        parse_started = time.perf_counter()
+        merged = parser.merge_pages([page for page, _, _ in pages])
+        status = self._cache_status(merged.status())
+        parse_time += time.perf_counter() - parse_started
+        self.last_parse_time = parse_time
+        self.last_fetch_time = time.perf_counter() - started - parse_time
+        return status
+
+    async def _async_login(self, parser: ModuleType) -> None:
+        """Log in and keep the session cookie the modem sets."""
+        self._cookie = self._cookie_expires = None
+        async with self.session.post(
+            self.url + parser.login_path(self.model),
+            data={"username": self.username, "password": self.password or ""},
+            allow_redirects=False,
+            timeout=FETCH_TIMEOUT,
+        ) as response:
+            if response.status in (401, 403):
+                raise ArrisAuthError(f"Login to {self.host} was rejected")
+            response.raise_for_status()
+            cookies = response.cookies
+
+        if not cookies:
+            raise ArrisAuthError(f"Login to {self.host} was rejected")
+        self._cookie = "; ".join(
+            f"{name}={morsel.value}" for name, morsel in cookies.items()
+        )
+        if max_ages := [
+            int(morsel["max-age"])
+            for morsel in cookies.values()
+            if morsel["max-age"].isdigit()
+        ]:
+            self._cookie_expires = asyncio.get_running_loop().time() + min(max_ages)
+
+    async def _async_read_pages(
+        self, parser: ModuleType
+    ) -> list[tuple[HTMLParser, int, float]]:
+        """Read the pages behind the login concurrently."""
+        return await asyncio.gather(
+            *(self._async_read_page(parser, path) for path in parser.page_paths(self.model))
+        )
+
+    async def _async_read_page(
+        self, parser: ModuleType, path: str
+    ) -> tuple[HTMLParser, int, float]:
+        """Read one page with the session cookie.
+
+        Returns the page's parser, the size of what was read and the time
+        spent parsing. A redirect (to the login page) or an
+        authorization error means the session has expired.
+        """
+        async with self._async_request(
+            self.url + path, headers={"Cookie": self._cookie}, allow_redirects=False
+        ) as response:
+            if response.status in (401, 403) or 300 <= response.status < 400:
+                raise _SessionExpired
+            response.raise_for_status()
+            page = parser.create_page(self.model)
+            _, size, parse_time = await self._async_feed(response, page)
+        return page, size, parse_time
+
+    async def _async_feed(
+        self, response: aiohttp.ClientResponse, page: HTMLParser
+    ) -> tuple[list[str], int, float]:
+        """Feed the response to a page parser as it arrives.
+
+        Reading stops as soon as the parser is done, so trailing markup
+        and scripts are neither waited for nor parsed. Returns the text
+        read, the number of bytes read and the time spent parsing.
+        """
         try:
-            table = soup.find("table", class_="simpleTable")
-            if not table:
-                return startup
-            
-            rows = table.find_all("tr")
-            for row in rows[2:]:
-                cols = row.find_all("td")
-                if len(cols) >= 2:
-                    procedure = cols[0].get_text(strip=True)
-                    status = cols[1].get_text(strip=True)
-                    
-                    if "Connectivity State" in procedure:
-                        startup["connectivity"] = status
-                    elif "Boot State" in procedure:
-                        startup["boot"] = status
-                    elif "Configuration File" in procedure:
-                        startup["config"] = status
-                    elif "Security" in procedure:
-                        startup["security"] = status
-        except Exception as err:
-            _LOGGER.error("Error parsing startup: %s", err)
-        
-        return startup
+            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(
+                errors="replace"
+            )
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # Text read so far, needed if the page has to be parsed again
+        text: list[str] = []
+        size = 0
+        parse_time = 0.0
+
+        async for chunk in response.content.iter_any():
+            size += len(chunk)
+            parse_started = time.perf_counter()
+            text.append(decoder.decode(chunk))
+            page.feed(text[-1])
+            parse_time += time.perf_counter() - parse_started
+            if page.done:
+                break
+        else:
+            parse_started = time.perf_counter()
+            text.append(decoder.decode(b"", final=True))
+            page.feed(text[-1])
+            page.close()
+            parse_time += time.perf_counter() - parse_started
+
+        return text, size, parse_time
 
-    def _parse_downstream(self, soup: BeautifulSoup) -> list[dict]:
-        """Parse downstream channels."""
-        channels = []
+    @asynccontextmanager
+    async def _async_request(
+        self, url: str, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """GET a page, keeping its connection once the caller is done.
+
+        A connection goes back to the keep-alive pool only once its body
+        has been read to the end. If the caller stopped reading early, the
+        rest is read in the background so the status is not held up by it.
+        """
+        response = await self.session.get(url, timeout=FETCH_TIMEOUT, **kwargs)
         try:
-            tables = soup.find_all("table", class_="simpleTable")
-            ds_table = None
-            
-            for table in tables:
-                header = table.find("th")
-                if header and "Downstream Bonded Channels" in header.get_text():
-                    ds_table = table
-                    break
-            
-            if not ds_table:
-                return channels
-            
-            rows = ds_table.find_all("tr")[2:]
-            for row in rows:
-                cols = row.find_all("td")
-                if len(cols) >= 9:
-                    try:
-                        channel = {
-                            "channel": int(cols[0].get_text(strip=True)),
-                            "lock_status": cols[1].get_text(strip=True),
-                            "modulation": cols[2].get_text(strip=True),
-                            "channel_id": int(cols[3].get_text(strip=True)),
-                            "frequency": int(cols[4].get_text(strip=True).replace(" Hz", "")),
-                            "power": float(cols[5].get_text(strip=True).replace(" dBmV", "")),
-                            "snr": float(cols[6].get_text(strip=True).replace(" dB", "")),
-                            "corrected": int(cols[7].get_text(strip=True)),
-                            "uncorrectable": int(cols[8].get_text(strip=True)),
-                        }
-                        channels.append(channel)
-                    except (ValueError, IndexError) as err:
-                        _LOGGER.warning("Error parsing downstream channel: %s", err)
-        except Exception as err:
-            _LOGGER.error("Error parsing downstream channels: %s", err)
-        
-        return channels
+            yield response
+        except BaseException:
+            response.close()
+            raise
+        if response.content.is_eof():
+            response.release()
+            return
+        drain = asyncio.create_task(self._async_drain(response))
+        self._drains.add(drain)
+        drain.add_done_callback(self._drains.discard)
 
-    def _parse_upstream(self, soup: BeautifulSoup) -> list[dict]:
-        """Parse upstream channels."""
-        channels = []
+    @staticmethod
+    async def _async_drain(response: aiohttp.ClientResponse) -> None:
+        """Read and drop the rest of a body, then release its connection.
+
+        A rest longer than FETCH_DRAIN_LIMIT would cost more than connecting
+        again, so the connection is closed instead, as it is when reading
+        fails or runs into the request's total timeout.
+        """
+        drained = 0
         try:
-            tables = soup.find_all("table", class_="simpleTable")
-            us_table = None
-            
-            for table in tables:
-                header = table.find("th")
-                if header and "Upstream Bonded Channels" in header.get_text():
-                    us_table = table
-                    break
-            
-            if not us_table:
-                return channels
-            
-            rows = us_table.find_all("tr")[2:]
-            for row in rows:
-                cols = row.find_all("td")
-                if len(cols) >= 7:
-                    try:
-                        channel = {
-                            "channel": int(cols[0].get_text(strip=True)),
-                            "lock_status": cols[1].get_text(strip=True),
-                            "channel_type": cols[2].get_text(strip=True),
-                            "channel_id": int(cols[3].get_text(strip=True)),
-                            "symbol_rate": cols[4].get_text(strip=True),
-                            "frequency": int(cols[5].get_text(strip=True).replace(" Hz", "")),
-                            "power": float(cols[6].get_text(strip=True).replace(" dBmV", "")),
-                        }
-                        channels.append(channel)
-                    except (ValueError, IndexError) as err:
-                        _LOGGER.warning("Error parsing upstream channel: %s", err)
-        except Exception as err:
-            _LOGGER.error("Error parsing upstream channels: %s", err)
-        
-        return channels
+            while chunk := await response.content.readany():
+                drained += len(chunk)
+                if drained > FETCH_DRAIN_LIMIT:
+                    response.close()
+                    return
+        except asyncio.CancelledError:
+            response.close()
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            response.close()
+            return
+        response.release()
+
+    def _cache_status(self, status: dict) -> dict:
+        """Remember a parsed status, keeping the cached one if it is equal.
+
+        The same dict object is returned for as long as the values parsed
+        from the page stay the same, so callers can skip work with an
+        identity check.
+        """
+        status_digest = hashlib.blake2b(
+            repr(status).encode(), digest_size=16
+        ).digest()
+        if status_digest != self._status_digest or self._status is None:
+            self._status_digest = status_digest
+            self._status = status
+        return self._status
+
+    def parse_status(self, html: str) -> dict:
+        """Parse the modem status page with the parser for its model.
+
+        Until the model is known the generic parser detects it, and the page
+        is parsed again if that model has its own parser. A known model that
+        yields no downstream channels (new firmware, a swapped modem) falls
+        back to detection.
+        """
+        return self._resolve_status(
+            get_parser(self.model).parse(html, self.model), html
+        )
+
+    def _resolve_status(self, status: dict, html: str) -> dict:
+        """Check a status parsed with the current model's parser.
+
+        Detects the model, and parses ``html`` again with the right parser,
+        when the model is unknown or its parser found no channels.
+        """
+        if self.model is not None:
+            if status["downstream"]:
+                return status
+            _LOGGER.debug("No channels parsed as %s, detecting model", self.model)
+            status = get_parser(None).parse(html)
 
+        model = status["model"]
+        if get_parser(model) is not get_parser(None):
+            status = get_parser(model).parse(html, model)
+        if has_parser(model):
+            self.model = model
 
+        return status
@@ -0,0 +1,44 @@
+"""Model-specific status page parsers.
+
+Every parser module is imported with the package, so no import happens on
+the event loop when a model's parser is first needed. Each one provides
+``parse(html, model=None) -> dict`` returning the modem status; when
+``model`` is None the parser detects it from the page. For pages read as
+they download, ``create_page(model=None)`` returns an ``HTMLParser`` to
+``feed()`` in pieces; its ``done`` attribute turns True once the rest of the
+page is not needed, and ``status()`` returns the status read so far.
+
+Models whose status is spread over pages behind a login also provide
+``login_path(model)`` (where the credentials are posted), ``page_paths(model)``
+(the pages to fetch once logged in) and ``merge_pages(pages)``, which
+combines the parsers the pages were fed to into one with a ``status()``.
+
+Models with an event log page provide ``event_log_path(model)`` and
+``parse_event_log(html)``, returning the entries oldest first.
+"""
+from __future__ import annotations
+
+from types import ModuleType
+
+from . import gateway, surfboard
+
+# Parser module for each model with a dedicated parser
+PARSER_MODULES: dict[str, ModuleType] = {
+    "SB6183": surfboard,
+    "SB6190": surfboard,
+    "TG1682G": gateway,
+    "TG3482G": gateway,
+}
+
+# Parser for unknown models and firmware; it also detects the model
+GENERIC_PARSER = surfboard
+
+
+def get_parser(model: str | None) -> ModuleType:
+    """Return the parser module for a model."""
+    return PARSER_MODULES.get(model, GENERIC_PARSER)
+
+
+def has_parser(model: str | None) -> bool:
+    """Return True if the model has a dedicated parser."""
+    return model in PARSER_MODULES
@@ -0,0 +1,349 @@
+"""Parser for TG-series gateway (TG1682G, TG3482G) status pages.
+
+Gateways show the cable modem status on the XFINITY Network page. Channel
+tables there are transposed: each row is one field (``Index``, ``SNR``,
+``Power Level``...) with one column per channel, and the error counters
+live in a separate ``CM Error Codewords`` table. The initialization steps
+are ``label: value`` form rows rather than a table.
+
+The root page can be read without logging in. With credentials, the
+status is collected from the pages behind the login instead: the network
+page, and the software page with the product information.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from html.parser import HTMLParser
+
+from ..models import DownstreamChannel, UpstreamChannel
+
+_LOGGER = logging.getLogger(__name__)
+
+# Initialization steps, in order, that make up the boot state
+BOOT_STEPS = (
+    "Initialize Hardware",
+    "Acquire Downstream Channel",
+    "Upstream Ranging",
+    "DHCP bound",
+    "Set Time-of-Day",
+    "Configuration File Download",
+    "Registration",
+)
+
+
+# Tables and form rows the status is built from; reading can stop once all
+# have been read
+REQUIRED_TABLES = ("Downstream", "Upstream", "Codewords")
+REQUIRED_FIELDS = ("Registration",)
+
+# Pages behind the login, without the extension of the model's web UI
+LOGIN_PAGE = "/check"
+STATUS_PAGES = ("/network_setup", "/software")
+
+# Product information form rows, and the keys they are reported under
+PRODUCT_FIELDS = {
+    "Hardware Version": "hardware_version",
+    "Software Version": "software_version",
+    "Serial Number": "serial_number",
+}
+
+
+def parse(html: str, model: str | None = None) -> dict:
+    """Parse a gateway status page, detecting the model unless it is given."""
+    page = create_page(model)
+    page.feed(html)
+    page.close()
+    return page.status()
+
+
+def create_page(model: str | None = None) -> GatewayPageParser:
+    """Return a parser to feed the page to, possibly in pieces."""
+    return GatewayPageParser(model)
+
+
+def login_path(model: str | None) -> str:
+    """Return the path the login form is posted to."""
+    return LOGIN_PAGE + _extension(model)
+
+
+def page_paths(model: str | None) -> list[str]:
+    """Return the paths of the pages the status is collected from."""
+    return [page + _extension(model) for page in STATUS_PAGES]
+
+
+def merge_pages(pages: list[GatewayPageParser]) -> GatewayPageParser:
+    """Combine the parsers of several pages into the first one.
+
+    Tables and form rows are taken from the first page that has them.
+    """
+    merged = pages[0]
+    for page in pages[1:]:
+        for title, table in page.tables.items():
+            merged.tables.setdefault(title, table)
+        for label, value in page.fields.items():
+            merged.fields.setdefault(label, value)
+        merged.text_model = merged.text_model or page.text_model
+    return merged
+
+
+def detect_model(page: GatewayPageParser) -> str:
+    """Detect the gateway model from the page."""
+    if model := page.fields.get("Model"):
+        return model
+    return page.text_model or "ARRIS Unknown"
+
+
+def parse_startup(page: GatewayPageParser) -> dict:
+    """Map the initialization steps onto the SURFboard startup states.
+
+    A step reading ``Complete`` is reported as ``OK``; otherwise the first
+    incomplete step's value is reported.
+    """
+    steps = page.fields
+    startup = {}
+    if (registration := steps.get("Registration")) is not None:
+        startup["connectivity"] = "OK" if registration == "Complete" else registration
+    if (config := steps.get("Configuration File Download")) is not None:
+        startup["config"] = "OK" if config == "Complete" else config
+    if present := [steps[step] for step in BOOT_STEPS if step in steps]:
+        startup["boot"] = next(
+            (value for value in present if value != "Complete"), "OK"
+        )
+    return startup
+
+
+def parse_product(page: GatewayPageParser) -> dict:
+    """Return the product information found on the pages."""
+    return {
+        key: page.fields[label]
+        for label, key in PRODUCT_FIELDS.items()
+        if page.fields.get(label)
+    }
+
+
+def parse_downstream(page: GatewayPageParser) -> list[DownstreamChannel]:
+    """Parse downstream channels."""
+    channels = []
+    try:
+        table = page.find_table("Downstream")
+        if not table:
+            return channels
+
+        # Error counters are matched to channels by index
+        codewords = page.find_table("Codewords") or {}
+        counter_columns = {
+            index: column for column, index in enumerate(codewords.get("Index", []))
+        }
+
+        for column, index in enumerate(table.get("Index", [])):
+            try:
+                counter_column = counter_columns.get(index)
+                channels.append(
+                    DownstreamChannel(
+                        channel=int(index),
+                        lock_status=_cell(table, "Lock Status", column),
+                        modulation=_cell(table, "Modulation", column),
+                        channel_id=int(index),
+                        frequency=_hertz(_cell(table, "Frequency", column)),
+                        power=_number(_cell(table, "Power Level", column)),
+                        snr=_number(_cell(table, "SNR", column)),
+                        corrected=_counter(
+                            codewords, "Correctable Codewords", counter_column
+                        ),
+                        uncorrectable=_counter(
+                            codewords, "Uncorrectable Codewords", counter_column
+                        ),
+                    )
+                )
+            except (ValueError, IndexError) as err:
+                _LOGGER.warning("Error parsing downstream channel: %s", err)
+    except Exception as err:
+        _LOGGER.error("Error parsing downstream channels: %s", err)
+
+    return channels
+
+
+def parse_upstream(page: GatewayPageParser) -> list[UpstreamChannel]:
+    """Parse upstream channels."""
+    channels = []
+    try:
+        table = page.find_table("Upstream")
+        if not table:
+            return channels
+
+        for column, index in enumerate(table.get("Index", [])):
+            try:
+                channels.append(
+                    UpstreamChannel(
+                        channel=int(index),
+                        lock_status=_cell(table, "Lock Status", column),
+                        channel_type=_cell(table, "Channel Type", column),
+                        channel_id=int(index),
+                        symbol_rate=_cell(table, "Symbol Rate", column),
+                        frequency=_hertz(_cell(table, "Frequency", column)),
+                        power=_number(_cell(table, "Power Level", column)),
+                    )
+                )
+            except (ValueError, IndexError) as err:
+                _LOGGER.warning("Error parsing upstream channel: %s", err)
+    except Exception as err:
+        _LOGGER.error("Error parsing upstream channels: %s", err)
+
+    return channels
+
+
+def _extension(model: str | None) -> str:
+    """Return the page extension of a model's web UI."""
+    return ".jst" if model and model.startswith("TG3482") else ".php"
+
+
+def _cell(table: dict[str, list[str]], label: str, column: int) -> str:
+    """Return one channel's value of a row, or an empty string."""
+    row = table.get(label, [])
+    return row[column] if column < len(row) else ""
+
+
+def _number(value: str) -> float:
+    """Parse a value such as ``38.9 dB`` or ``2.3 dBmV``."""
+    return float(value.split()[0])
+
+
+def _hertz(value: str) -> int:
+    """Parse a frequency such as ``549 MHz`` or ``549000000 Hz`` into Hz."""
+    number, _, unit = value.partition(" ")
+    if unit.strip().lower() == "mhz":
+        return round(float(number) * 1_000_000)
+    return int(float(number))
+
+
+def _counter(table: dict[str, list[str]], label: str, column: int | None) -> int:
+    """Return an error counter, or 0 if the channel has none."""
+    if column is None:
+        return 0
+    return int(_cell(table, label, column) or 0)
+
+
+class GatewayPageParser(HTMLParser):
+    """Tokenize a gateway page once, keeping only what the parsers use.
+
+    Collects every ``data`` table as a mapping of row label (the row's
+    ``<th>``) to its ``<td>`` texts, keyed by the table's title (its first
+    ``<th>``), plus the ``readonlyLabel``/``value`` form rows and the first
+    model number found in the page text.
+
+    The page can be fed in pieces. ``done`` turns True once the
+    REQUIRED_TABLES and REQUIRED_FIELDS have been read and, unless ``model``
+    was given, a model hint has been seen.
+    """
+
+    _MODEL_RE = re.compile(r"(TG\d{4}[A-Z]?|SB\d{4})")
+
+    def __init__(self, model: str | None = None) -> None:
+        """Initialize the parser."""
+        super().__init__(convert_charrefs=True)
+        self.model = model
+        self.done = False
+        self.tables: dict[str, dict[str, list[str]]] = {}
+        self.fields: dict[str, str] = {}
+        self.text_model: str | None = None
+        self._table: dict[str, list[str]] | None = None
+        self._title: str | None = None
+        self._label: str | None = None
+        self._cells: list[str] | None = None
+        self._text: list[str] | None = None
+        self._text_tag: str | None = None
+        self._field_label: str | None = None
+        self._span: str | None = None
+        self._skip = 0
+
+    def status(self) -> dict:
+        """Return the modem status read from the page so far."""
+        return {
+            "model": self.model or detect_model(self),
+            "startup": parse_startup(self),
+            "product": parse_product(self),
+            "downstream": parse_downstream(self),
+            "upstream": parse_upstream(self),
+        }
+
+    def find_table(self, title: str) -> dict[str, list[str]] | None:
+        """Return the first table whose title mentions ``title``."""
+        for table_title, table in self.tables.items():
+            if title in table_title:
+                return table
+        return None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Track tables, rows, cells and form rows."""
+        if tag in ("script", "style"):
+            self._skip += 1
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        if tag == "table":
+            self._table = {} if "data" in classes else None
+            self._title = None
+        elif self._table is not None and tag == "tr":
+            self._end_row()
+            self._cells = []
+        elif self._table is not None and tag in ("th", "td"):
+            self._text, self._text_tag = [], tag
+        elif tag == "span" and "readonlyLabel" in classes:
+            self._text, self._text_tag, self._span = [], tag, "label"
+        elif tag == "span" and "value" in classes and self._field_label:
+            self._text, self._text_tag, self._span = [], tag, "value"
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close cells, rows, tables and form rows."""
+        if tag in ("script", "style"):
+            self._skip = max(self._skip - 1, 0)
+            return
+        if tag == "table" and self._table is not None:
+            self._end_row()
+            if self._title is not None:
+                self.tables.setdefault(self._title, self._table)
+            self._table = None
+            self._check_done()
+        elif tag == "tr" and self._table is not None:
+            self._end_row()
+        elif tag == self._text_tag and self._text is not None:
+            text = "".join(self._text).strip()
+            self._text = self._text_tag = None
+            if tag == "th" and self._title is None:
+                self._title = text
+            elif tag == "th":
+                self._label = text
+            elif tag == "td" and self._cells is not None:
+                self._cells.append(text)
+            elif self._span == "label":
+                self._field_label = text.rstrip(":").strip()
+            elif self._span == "value":
+                self.fields.setdefault(self._field_label, text)
+                self._field_label = None
+                self._check_done()
+
+    def handle_data(self, data: str) -> None:
+        """Collect text and look for a model number."""
+        if self._skip:
+            return
+        if self._text is not None:
+            self._text.append(data)
+        if self.text_model is None and (match := self._MODEL_RE.search(data)):
+            self.text_model = match.group(1)
+
+    def _check_done(self) -> None:
+        """Set ``done`` once everything the status needs has been read."""
+        if self.done:
+            return
+        if self.model is None and not ("Model" in self.fields or self.text_model):
+            return
+        self.done = all(
+            self.find_table(title) is not None for title in REQUIRED_TABLES
+        ) and all(field in self.fields for field in REQUIRED_FIELDS)
+
+    def _end_row(self) -> None:
+        """Finish the open row, if any."""
+        if self._table is not None and self._label and self._cells is not None:
+            self._table.setdefault(self._label, self._cells)
+        self._label = None
+        self._cells = None
@@ -0,0 +1,357 @@
+"""Parser for SURFboard (SB-series) status pages.
+
+This is also the generic parser: it detects the model from the page and is
+used for any firmware without a dedicated parser.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from html.parser import HTMLParser
+
+from ..models import DownstreamChannel, EventLogEntry, UpstreamChannel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Tables the status is built from; reading can stop once all are closed
+REQUIRED_TABLES = (
+    "Startup Procedure",
+    "Downstream Bonded Channels",
+    "Upstream Bonded Channels",
+)
+
+
+# Event log page, a table of time, priority and description rows, for the
+# models that do not serve it at EVENT_LOG_PAGE
+EVENT_LOG_PAGE = "/RgEventLog.asp"
+EVENT_LOG_PAGES = {
+    "SB8200": "/cmeventlog.html",
+}
+
+
+def parse(html: str, model: str | None = None) -> dict:
+    """Parse a status page, detecting the model unless it is given."""
+    page = create_page(model)
+    page.feed(html)
+    page.close()
+    return page.status()
+
+
+def create_page(model: str | None = None) -> StatusPageParser:
+    """Return a parser to feed the page to, possibly in pieces."""
+    return StatusPageParser(model)
+
+
+def event_log_path(model: str | None) -> str:
+    """Return the path of a model's event log page."""
+    return EVENT_LOG_PAGES.get(model, EVENT_LOG_PAGE)
+
+
+def detect_model(page: StatusPageParser) -> str:
+    """Detect the modem model from the page."""
+    try:
+        # Look for model number in binnacle
+        if page.model_number is not None:
+            return page.model_number
+
+        # Look in page title
+        if page.title is not None:
+            # Try to extract model from title
+            for model in ["SB6183", "SB6190", "TG1682G", "TG3482G"]:
+                if model in page.title:
+                    return model
+
+        # Look in page content
+        if page.text_model is not None:
+            return page.text_model
+
+        return "ARRIS Unknown"
+    except Exception as err:
+        _LOGGER.debug("Could not detect model: %s", err)
+        return "ARRIS Unknown"
+
+
+def parse_startup(page: StatusPageParser) -> dict:
+    """Parse startup procedure table."""
+    startup = {}
+    try:
+        if not page.tables:
+            return startup
+
+        for cols in page.tables[0].rows[2:]:
+            if len(cols) >= 2:
+                procedure = cols[0]
+                status = cols[1]
+
+                if "Connectivity State" in procedure:
+                    startup["connectivity"] = status
+                elif "Boot State" in procedure:
+                    startup["boot"] = status
+                elif "Configuration File" in procedure:
+                    startup["config"] = status
+                elif "Security" in procedure:
+                    startup["security"] = status
+    except Exception as err:
+        _LOGGER.error("Error parsing startup: %s", err)
+
+    return startup
+
+
+def parse_downstream(page: StatusPageParser) -> list[DownstreamChannel]:
+    """Parse downstream channels."""
+    channels = []
+    try:
+        ds_table = page.find_table("Downstream Bonded Channels")
+        if not ds_table:
+            return channels
+
+        for cols in ds_table.rows[2:]:
+            if len(cols) >= 9:
+                try:
+                    channels.append(
+                        DownstreamChannel(
+                            channel=int(cols[0]),
+                            lock_status=cols[1],
+                            modulation=cols[2],
+                            channel_id=int(cols[3]),
+                            frequency=int(cols[4].replace(" Hz", "")),
+                            power=float(cols[5].replace(" dBmV", "")),
+                            snr=float(cols[6].replace(" dB", "")),
+                            corrected=int(cols[7]),
+                            uncorrectable=int(cols[8]),
+                        )
+                    )
+                except (ValueError, IndexError) as err:
+                    _LOGGER.warning("Error parsing downstream channel: %s", err)
+    except Exception as err:
+        _LOGGER.error("Error parsing downstream channels: %s", err)
+
+    return channels
+
+
+def parse_upstream(page: StatusPageParser) -> list[UpstreamChannel]:
+    """Parse upstream channels."""
+    channels = []
+    try:
+        us_table = page.find_table("Upstream Bonded Channels")
+        if not us_table:
+            return channels
+
+        for cols in us_table.rows[2:]:
+            if len(cols) >= 7:
+                try:
+                    channels.append(
+                        UpstreamChannel(
+                            channel=int(cols[0]),
+                            lock_status=cols[1],
+                            channel_type=cols[2],
+                            channel_id=int(cols[3]),
+                            symbol_rate=cols[4],
+                            frequency=int(cols[5].replace(" Hz", "")),
+                            power=float(cols[6].replace(" dBmV", "")),
+                        )
+                    )
+                except (ValueError, IndexError) as err:
+                    _LOGGER.warning("Error parsing upstream channel: %s", err)
+    except Exception as err:
+        _LOGGER.error("Error parsing upstream channels: %s", err)
+
+    return channels
+
+
+def parse_event_log(html: str) -> list[EventLogEntry]:
+    """Parse the event log page.
+
+    The modem lists the newest entry last, which is the order returned.
+    Raises ValueError if the page has no event log table.
+    """
+    page = StatusPageParser()
+    page.feed(html)
+    page.close()
+    if (table := page.find_table("Event Log")) is None:
+        raise ValueError("No event log table in the page")
+    return [
+        EventLogEntry(time=cols[0], priority=cols[1], description=cols[2])
+        for cols in table.rows
+        if len(cols) >= 3 and cols[0] != "Time"
+    ]
+
+
+class StatusTable:
+    """A ``simpleTable`` table collected from the status page."""
+
+    __slots__ = ("closed", "header", "rows")
+
+    def __init__(self) -> None:
+        """Initialize the table."""
+        self.header: str | None = None
+        self.rows: list[list[str]] = []
+        self.closed = False
+
+
+class StatusPageParser(HTMLParser):
+    """Tokenize the status page once, keeping only what the parsers use.
+
+    Collects every ``simpleTable`` as rows of stripped ``<td>`` texts along
+    with the first ``<th>`` text, plus the model hints (the
+    ``thisModelNumberIs`` span, the page title and the first model number
+    found in the page text).
+
+    The page can be fed in pieces. ``done`` turns True once the
+    REQUIRED_TABLES are closed and, unless ``model`` was given, a model hint
+    has been seen; the rest of the page is then not needed.
+    """
+
+    _MODEL_RE = re.compile(r"(SB\d{4}|TG\d{4}[A-Z]?)")
+
+    def __init__(self, model: str | None = None) -> None:
+        """Initialize the parser."""
+        super().__init__(convert_charrefs=True)
+        self.model = model
+        self.done = False
+        self.tables: list[StatusTable] = []
+        self.model_number: str | None = None
+        self.title: str | None = None
+        self.text_model: str | None = None
+        # Innermost open table; None for tables that are not simpleTables
+        self._tables: list[StatusTable | None] = []
+        # Row/cell state of the enclosing tables while a nested one is open
+        self._saved: list[tuple] = []
+        self._row: list[str] | None = None
+        self._cell: list[str] | None = None
+        # Raw text of the current text node in a cell; a node can arrive in
+        # pieces when the page is fed in pieces
+        self._cell_text: list[str] = []
+        self._header: list[str] | None = None
+        self._capture: list[str] | None = None
+        self._capture_tag: str | None = None
+        self._skip = 0
+
+    def status(self) -> dict:
+        """Return the modem status read from the page so far."""
+        return {
+            "model": self.model or detect_model(self),
+            "startup": parse_startup(self),
+            "downstream": parse_downstream(self),
+            "upstream": parse_upstream(self),
+        }
+
+    def find_table(self, header: str) -> StatusTable | None:
+        """Return the first table whose header mentions ``header``."""
+        for table in self.tables:
+            if table.header and header in table.header:
+                return table
+        return None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Track table structure and model hints."""
+        self._end_cell_text()
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag == "table":
+            self._saved.append((self._row, self._cell, self._header))
+            self._row = self._cell = self._header = None
+            classes = (dict(attrs).get("class") or "").split()
+            table = StatusTable() if "simpleTable" in classes else None
+            if table is not None:
+                self.tables.append(table)
+            self._tables.append(table)
+        elif tag == "tr":
+            self._end_row()
+            if self._tables and self._tables[-1] is not None:
+                self._row = []
+        elif tag in ("td", "th"):
+            self._end_cell()
+            table = self._tables[-1] if self._tables else None
+            if table is None:
+                return
+            if tag == "td" and self._row is not None:
+                self._cell = []
+            elif tag == "th" and table.header is None:
+                self._header = []
+        elif tag == "title" and self.title is None:
+            self._capture, self._capture_tag = [], tag
+        elif (
+            tag == "span"
+            and self.model_number is None
+            and dict(attrs).get("id") == "thisModelNumberIs"
+        ):
+            self._capture, self._capture_tag = [], tag
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close cells, rows, tables and captures."""
+        self._end_cell_text()
+        if tag in ("script", "style"):
+            self._skip = max(self._skip - 1, 0)
+        elif tag == "table" and self._tables:
+            self._end_row()
+            if (table := self._tables.pop()) is not None:
+                table.closed = True
+            self._row, self._cell, self._header = self._saved.pop()
+            self._check_done()
+        elif tag == "tr":
+            self._end_row()
+        elif tag in ("td", "th"):
+            self._end_cell()
+        elif tag == self._capture_tag and self._capture is not None:
+            if tag == "title":
+                self.title = "".join(self._capture)
+            else:
+                self.model_number = "".join(s.strip() for s in self._capture)
+            self._capture = self._capture_tag = None
+            self._check_done()
+
+    def handle_data(self, data: str) -> None:
+        """Collect cell text and look for a model number."""
+        if self._skip:
+            return
+        if self._cell is not None:
+            self._cell_text.append(data)
+        if self._header is not None:
+            self._header.append(data)
+        if self._capture is not None:
+            self._capture.append(data)
+        if self.text_model is None and (match := self._MODEL_RE.search(data)):
+            self.text_model = match.group(1)
+
+    def _check_done(self) -> None:
+        """Set ``done`` once everything the status needs has been read."""
+        if self.done:
+            return
+        if self.model is None and not (self.model_number or self.text_model):
+            return
+        closed = [
+            table.header for table in self.tables if table.header and table.closed
+        ]
+        self.done = all(
+            any(required in header for header in closed)
+            for required in REQUIRED_TABLES
+        )
+
+    def _end_cell_text(self) -> None:
+        """Add the stripped text node to the open cell, if any."""
+        if self._cell_text:
+            if self._cell is not None and (text := "".join(self._cell_text).strip()):
+                self._cell.append(text)
+            self._cell_text = []
+
+    def _end_cell(self) -> None:
+        """Finish the open cell or header, if any."""
+        if self._cell is not None:
+            self._end_cell_text()
+            if self._row is not None:
+                self._row.append("".join(self._cell))
+            self._cell = None
+        if self._header is not None:
+            if self._tables and self._tables[-1] is not None:
+                self._tables[-1].header = "".join(self._header)
+            self._header = None
+
+    def _end_row(self) -> None:
+        """Finish the open row, if any."""
+        self._end_cell()
+        if self._row is not None:
+            if self._tables and self._tables[-1] is not None:
+                self._tables[-1].rows.append(self._row)
+            self._row = None
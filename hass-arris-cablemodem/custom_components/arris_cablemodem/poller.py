@@ -0,0 +1,141 @@
+"""Shared poll scheduler for all configured ARRIS modems."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from datetime import datetime
+from functools import partial
+
+import aiohttp
+import async_timeout
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_call_later
+
+from .const import FETCH_TOTAL_TIMEOUT, FLEET_MAX_CONCURRENT_FETCHES
+from .coordinator import ArrisDataUpdateCoordinator
+from .modem import ArrisModem
+from .models import EventLogEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ArrisFleetPoller:
+    """Own every ArrisModem and decide when each one is polled.
+
+    All modems share one pooled HTTP session, at most
+    FLEET_MAX_CONCURRENT_FETCHES status pages are fetched at once, and polls
+    are spread out so modems on the same interval do not line up. Each
+    config entry's coordinator is refreshed by the poller and receives the
+    fetched status through ``async_fetch``.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the poller."""
+        self.hass = hass
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENT_FETCHES)
+        self._modems: dict[str, ArrisModem] = {}
+        self._coordinators: dict[str, ArrisDataUpdateCoordinator] = {}
+        self._unsub: dict[str, CALLBACK_TYPE] = {}
+        # Loop time the poll slots are counted from
+        self._epoch = hass.loop.time()
+
+    @callback
+    def async_add_modem(
+        self,
+        entry_id: str,
+        host: str,
+        model: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+    ) -> ArrisModem:
+        """Create the modem of a config entry on the shared session."""
+        if self._session is None:
+            # Not tied to the entry being set up; detached with the last modem
+            self._session = async_create_clientsession(self.hass, auto_cleanup=False)
+        modem = ArrisModem(host, self._session, model, username, password)
+        self._modems[entry_id] = modem
+        return modem
+
+    @callback
+    def async_start(
+        self,
+        entry_id: str,
+        coordinator: ArrisDataUpdateCoordinator,
+        delay: float | None = None,
+    ) -> None:
+        """Start polling a config entry.
+
+        The first poll is due after ``delay`` seconds, by default the
+        coordinator's poll interval.
+        """
+        self._coordinators[entry_id] = coordinator
+        self._schedule(
+            entry_id, coordinator.poll_interval if delay is None else delay
+        )
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Stop polling a config entry and drop its modem."""
+        if unsub := self._unsub.pop(entry_id, None):
+            unsub()
+        self._coordinators.pop(entry_id, None)
+        if (modem := self._modems.pop(entry_id, None)) is not None:
+            modem.async_close()
+
+        if not self._modems and self._session is not None:
+            self._session.detach()
+            self._session = None
+
+    async def async_fetch(self, modem: ArrisModem) -> dict:
+        """Fetch a modem's status, waiting for a free fetch slot.
+
+        The time limit starts once the slot is taken, so modems that hang
+        and hold every slot do not use up the budget of the others.
+        """
+        async with self._semaphore:
+            async with async_timeout.timeout(FETCH_TOTAL_TIMEOUT):
+                return await modem.async_get_status()
+
+    async def async_fetch_event_log(self, modem: ArrisModem) -> list[EventLogEntry] | None:
+        """Fetch a modem's event log, waiting for a free fetch slot."""
+        async with self._semaphore:
+            async with async_timeout.timeout(FETCH_TOTAL_TIMEOUT):
+                return await modem.async_get_event_log()
+
+    def _schedule(self, entry_id: str, delay: float) -> None:
+        """Schedule the next poll of an entry, spaced from the others."""
+        now = self.hass.loop.time()
+        due = self._next_slot(entry_id, now + delay)
+        self._unsub[entry_id] = async_call_later(
+            self.hass,
+            due - now,
+            HassJob(partial(self._async_poll, entry_id), cancel_on_shutdown=True),
+        )
+
+    def _next_slot(self, entry_id: str, due: float) -> float:
+        """Move ``due`` to the nearest poll slot owned by the entry.
+
+        The shortest minimum interval among the modems is the slot period;
+        it is divided evenly between the modems so each owns one offset in
+        it. Polls therefore never line up, and the interval each modem asked
+        for changes by at most half a period.
+        """
+        period = min(c.min_interval for c in self._coordinators.values())
+        order = list(self._coordinators)
+        offset = self._epoch + order.index(entry_id) * period / len(order)
+        return offset + math.ceil((due - period / 2 - offset) / period) * period
+
+    async def _async_poll(self, entry_id: str, _now: datetime) -> None:
+        """Refresh an entry's coordinator and schedule its next poll."""
+        self._unsub.pop(entry_id, None)
+        if (coordinator := self._coordinators.get(entry_id)) is None:
+            return
+
+        await coordinator.async_refresh()
+
+        # An entry reloaded during the refresh is scheduled by its new setup
+        if self._coordinators.get(entry_id) is coordinator:
+            self._schedule(entry_id, coordinator.poll_interval)
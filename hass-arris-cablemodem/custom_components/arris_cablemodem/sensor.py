@@ -1,8 +1,10 @@
 """Sensor platform for ARRIS Surfboard Cable Modems."""
 from __future__ import annotations
 
+import re
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,12 +13,22 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, UnitOfFrequency
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfFrequency,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .entity import ArrisEntity
+from .stats import PollStats
 
 
 @dataclass
@@ -24,7 +36,20 @@ class ArrisSensorEntityDescription(SensorEntityDescription):
     """Describe ARRIS sensor entity."""
 
     value_fn: Callable[[dict], any] = None
+    attributes_fn: Callable[[dict], dict] | None = None
+
+
+@dataclass
+class ArrisDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describe ARRIS poll statistics sensor entity."""
 
+    value_fn: Callable[[PollStats], any] = None
+    attributes_fn: Callable[[PollStats], dict] | None = None
+
+
+# Channel fields with a sensor per bonded channel, and their key prefixes
+CHANNEL_SENSOR_FIELDS = {"downstream": ("power", "snr"), "upstream": ("power",)}
+CHANNEL_KEY_PREFIXES = {"downstream": "ds_ch", "upstream": "us_ch"}
 
 SENSOR_TYPES: tuple[ArrisSensorEntityDescription, ...] = (
     ArrisSensorEntityDescription(
@@ -49,14 +74,14 @@ SENSOR_TYPES: tuple[ArrisSensorEntityDescription, ...] = (
         key="ds_channels",
         name="Downstream Channels",
         icon="mdi:download-network",
-        value_fn=lambda data: len(data.get("downstream", [])),
+        value_fn=lambda data: data["summary"]["downstream"]["count"],
         state_class=SensorStateClass.MEASUREMENT,
     ),
     ArrisSensorEntityDescription(
         key="us_channels",
         name="Upstream Channels",
         icon="mdi:upload-network",
-        value_fn=lambda data: len(data.get("upstream", [])),
+        value_fn=lambda data: data["summary"]["upstream"]["count"],
         state_class=SensorStateClass.MEASUREMENT,
     ),
     ArrisSensorEntityDescription(
@@ -67,10 +92,7 @@ SENSOR_TYPES: tuple[ArrisSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
-        value_fn=lambda data: round(
-            sum(ch["power"] for ch in data.get("downstream", [])) / len(data.get("downstream", []))
-            if data.get("downstream") else None, 1
-        ),
+        value_fn=lambda data: data["summary"]["downstream"]["avg_power"],
     ),
     ArrisSensorEntityDescription(
         key="ds_avg_snr",
@@ -80,10 +102,7 @@ SENSOR_TYPES: tuple[ArrisSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
-        value_fn=lambda data: round(
-            sum(ch["snr"] for ch in data.get("downstream", [])) / len(data.get("downstream", []))
-            if data.get("downstream") else None, 1
-        ),
+        value_fn=lambda data: data["summary"]["downstream"]["avg_snr"],
     ),
     ArrisSensorEntityDescription(
         key="us_avg_power",
@@ -93,24 +112,158 @@ SENSOR_TYPES: tuple[ArrisSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
-        value_fn=lambda data: round(
-            sum(ch["power"] for ch in data.get("upstream", [])) / len(data.get("upstream", []))
-            if data.get("upstream") else None, 1
-        ),
+        value_fn=lambda data: data["summary"]["upstream"]["avg_power"],
     ),
     ArrisSensorEntityDescription(
         key="ds_total_corrected",
         name="Downstream Total Corrected Errors",
         icon="mdi:alert-circle",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: sum(ch["corrected"] for ch in data.get("downstream", [])),
+        value_fn=lambda data: data["summary"]["downstream"]["total_corrected"],
     ),
     ArrisSensorEntityDescription(
         key="ds_total_uncorrectable",
         name="Downstream Total Uncorrectable Errors",
         icon="mdi:alert",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: sum(ch["uncorrectable"] for ch in data.get("downstream", [])),
+        value_fn=lambda data: data["summary"]["downstream"]["total_uncorrectable"],
+    ),
+    ArrisSensorEntityDescription(
+        key="ds_power_spread",
+        name="Downstream Power Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement="dB",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: data["summary"]["downstream"]["power_spread"],
+    ),
+    ArrisSensorEntityDescription(
+        key="ds_min_snr",
+        name="Downstream Minimum SNR",
+        icon="mdi:signal-variant",
+        native_unit_of_measurement="dB",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: data["summary"]["downstream"]["min_snr"],
+    ),
+    ArrisSensorEntityDescription(
+        key="us_power_spread",
+        name="Upstream Power Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement="dB",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: data["summary"]["upstream"]["power_spread"],
+    ),
+    ArrisSensorEntityDescription(
+        key="ds_snr_drops",
+        name="Downstream Channels With SNR Drop",
+        icon="mdi:signal-off",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: _anomaly_count(data, "snr_drop"),
+        attributes_fn=lambda data: _anomaly_attributes(data, "snr_drop"),
+    ),
+    ArrisSensorEntityDescription(
+        key="ds_error_spikes",
+        name="Downstream Channels With Error Spike",
+        icon="mdi:alert-octagram",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: _anomaly_count(data, "error_spike"),
+        attributes_fn=lambda data: _anomaly_attributes(data, "error_spike"),
+    ),
+    ArrisSensorEntityDescription(
+        key="ds_counter_reset",
+        name="Downstream Error Counter Reset",
+        icon="mdi:counter",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: _last_counter_reset(data),
+    ),
+)
+
+
+def _anomaly_count(data: dict, kind: str) -> int | None:
+    """Return how many channels have an anomaly, None before the first poll."""
+    if (anomalies := data.get("anomalies")) is None:
+        return None
+    return len(anomalies[kind])
+
+
+def _anomaly_attributes(data: dict, kind: str) -> dict | None:
+    """Return the anomalous channels with their values and baselines."""
+    if (anomalies := data.get("anomalies")) is None:
+        return None
+    return {"channels": anomalies[kind]}
+
+
+def _last_counter_reset(data: dict) -> datetime | None:
+    """Return when the uncorrectable counters last went back down."""
+    anomalies = data.get("anomalies") or {}
+    if (timestamp := anomalies.get("last_counter_reset")) is None:
+        return None
+    return dt_util.utc_from_timestamp(timestamp)
+
+
+def _timing_description(
+    key: str, name: str, phase: str
+) -> ArrisDiagnosticSensorEntityDescription:
+    """Describe a sensor holding the last timing of a poll phase."""
+    return ArrisDiagnosticSensorEntityDescription(
+        key=key,
+        name=name,
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.timing_ms(phase)["last"],
+        attributes_fn=lambda stats: {
+            key: value
+            for key, value in stats.timing_ms(phase).items()
+            if key in ("p50", "p95")
+        },
+    )
+
+
+DIAGNOSTIC_SENSOR_TYPES: tuple[ArrisDiagnosticSensorEntityDescription, ...] = (
+    _timing_description("poll_time", "Poll Time", "poll"),
+    _timing_description("fetch_time", "Fetch Time", "fetch"),
+    _timing_description("parse_time", "Parse Time", "parse"),
+    _timing_description("update_time", "Entity Update Time", "update"),
+    ArrisDiagnosticSensorEntityDescription(
+        key="response_size",
+        name="Response Size",
+        icon="mdi:file-download-outline",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.response_size.last,
+    ),
+    ArrisDiagnosticSensorEntityDescription(
+        key="poll_failures",
+        name="Poll Failures",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.failures,
+        attributes_fn=lambda stats: dict(stats.failure_reasons),
+    ),
+    ArrisDiagnosticSensorEntityDescription(
+        key="last_failure",
+        name="Last Poll Failure",
+        icon="mdi:alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.last_failure,
     ),
 )
 
@@ -131,91 +284,123 @@ async def async_setup_entry(
     # Add main sensors
     for description in SENSOR_TYPES:
         entities.append(ArrisSensor(coordinator, description, entry, model))
+
+    # Add poll statistics sensors
+    for description in DIAGNOSTIC_SENSOR_TYPES:
+        entities.append(
+            ArrisDiagnosticSensor(coordinator, description, entry, model)
+        )
     
-    # Add per-channel sensors
-    if coordinator.data:
-        # Downstream channel sensors
-        for channel in coordinator.data.get("downstream", []):
-            ch_num = channel["channel"]
-            entities.extend([
-                ArrisChannelSensor(
-                    coordinator,
-                    ArrisSensorEntityDescription(
-                        key=f"ds_ch{ch_num}_power",
-                        name=f"DS Channel {ch_num} Power",
-                        icon="mdi:signal",
-                        native_unit_of_measurement="dBmV",
-                        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=1,
-                    ),
-                    entry,
-                    model,
-                    "downstream",
-                    ch_num,
-                    "power",
-                ),
-                ArrisChannelSensor(
-                    coordinator,
-                    ArrisSensorEntityDescription(
-                        key=f"ds_ch{ch_num}_snr",
-                        name=f"DS Channel {ch_num} SNR",
-                        icon="mdi:signal-variant",
-                        native_unit_of_measurement="dB",
-                        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=1,
-                    ),
-                    entry,
-                    model,
-                    "downstream",
-                    ch_num,
-                    "snr",
-                ),
-            ])
-        
-        # Upstream channel sensors
-        for channel in coordinator.data.get("upstream", []):
-            ch_num = channel["channel"]
-            entities.append(
+    async_add_entities(entities)
+
+    # Add and remove per-channel sensors as the bonded channels change
+    channels: set[tuple[str, int]] = set()
+
+    @callback
+    def _async_update_channels() -> None:
+        """Diff the bonded channels against the channels with sensors."""
+        index = coordinator.data["channel_index"]
+        current = {
+            (direction, ch_num)
+            for direction in CHANNEL_SENSOR_FIELDS
+            for ch_num in index[direction]
+        }
+        # A modem that is rebooting reports no channels; keep the sensors
+        # and the channels they belong to until the channels come back
+        if not current or current == channels:
+            return
+        if added := current - channels:
+            async_add_entities(
                 ArrisChannelSensor(
                     coordinator,
-                    ArrisSensorEntityDescription(
-                        key=f"us_ch{ch_num}_power",
-                        name=f"US Channel {ch_num} Power",
-                        icon="mdi:signal",
-                        native_unit_of_measurement="dBmV",
-                        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=1,
-                    ),
+                    _channel_description(direction, ch_num, field),
                     entry,
                     model,
-                    "upstream",
+                    direction,
                     ch_num,
-                    "power",
+                    field,
                 )
+                for direction, ch_num in sorted(added)
+                for field in CHANNEL_SENSOR_FIELDS[direction]
             )
-    
-    async_add_entities(entities)
+        # The first time, sensors of channels dropped while Home Assistant
+        # was stopped are removed too
+        if not channels or channels - current:
+            _async_remove_channel_sensors(hass, entry, current)
+        channels.clear()
+        channels.update(current)
+
+    _async_update_channels()
+    entry.async_on_unload(coordinator.async_add_listener(_async_update_channels))
+
+
+@callback
+def _async_remove_channel_sensors(
+    hass: HomeAssistant, entry: ConfigEntry, current: set[tuple[str, int]]
+) -> None:
+    """Remove the sensors of channels that are no longer bonded.
+
+    Works from the entity registry, so sensors of channels dropped while
+    Home Assistant was stopped, and disabled sensors, are removed too.
+    """
+    keep = {
+        _channel_unique_id(entry, direction, ch_num, field)
+        for direction, ch_num in current
+        for field in CHANNEL_SENSOR_FIELDS[direction]
+    }
+    pattern = re.compile(rf"{re.escape(entry.entry_id)}_(?:ds|us)_ch\d+_\w+")
+    registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if (
+            pattern.fullmatch(entity_entry.unique_id)
+            and entity_entry.unique_id not in keep
+        ):
+            registry.async_remove(entity_entry.entity_id)
+
+
+def _channel_unique_id(
+    entry: ConfigEntry, direction: str, ch_num: int, field: str
+) -> str:
+    """Return the unique ID of a channel sensor."""
+    return f"{entry.entry_id}_{CHANNEL_KEY_PREFIXES[direction]}{ch_num}_{field}"
+
+
+def _channel_description(
+    direction: str, ch_num: int, field: str
+) -> ArrisSensorEntityDescription:
+    """Describe the sensor of one field of a channel."""
+    label = "DS" if direction == "downstream" else "US"
+    if field == "snr":
+        return ArrisSensorEntityDescription(
+            key=f"{CHANNEL_KEY_PREFIXES[direction]}{ch_num}_snr",
+            name=f"{label} Channel {ch_num} SNR",
+            icon="mdi:signal-variant",
+            native_unit_of_measurement="dB",
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+        )
+    return ArrisSensorEntityDescription(
+        key=f"{CHANNEL_KEY_PREFIXES[direction]}{ch_num}_power",
+        name=f"{label} Channel {ch_num} Power",
+        icon="mdi:signal",
+        native_unit_of_measurement="dBmV",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+    )
 
 
-class ArrisSensor(CoordinatorEntity, SensorEntity):
+class ArrisSensor(ArrisEntity, SensorEntity):
     """Representation of an ARRIS sensor."""
 
     entity_description: ArrisSensorEntityDescription
 
     def __init__(self, coordinator, description, entry, model):
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, model)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": model,
-            "manufacturer": "ARRIS",
-            "model": model,
-        }
 
     @property
     def native_value(self):
@@ -224,33 +409,75 @@ class ArrisSensor(CoordinatorEntity, SensorEntity):
             return self.entity_description.value_fn(self.coordinator.data)
         return None
 
+    @property
+    def extra_state_attributes(self):
+        """Return the anomalous channels of the problem sensors."""
+        if self.entity_description.attributes_fn:
+            return self.entity_description.attributes_fn(self.coordinator.data)
+        return None
+
+
+class ArrisDiagnosticSensor(ArrisEntity, SensorEntity):
+    """Representation of an ARRIS poll statistics sensor."""
 
-class ArrisChannelSensor(CoordinatorEntity, SensorEntity):
+    entity_description: ArrisDiagnosticSensorEntityDescription
+
+    def __init__(self, coordinator, description, entry, model):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, model)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Also update after polls that did not change the modem data."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.stats_signal,
+                self._handle_coordinator_update,
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True; the statistics also describe failed polls."""
+        return True
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.stats)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the rolling percentiles or failure breakdown."""
+        if self.entity_description.attributes_fn:
+            return self.entity_description.attributes_fn(self.coordinator.stats)
+        return None
+
+
+class ArrisChannelSensor(ArrisEntity, SensorEntity):
     """Representation of an ARRIS channel sensor."""
 
     entity_description: ArrisSensorEntityDescription
 
     def __init__(self, coordinator, description, entry, model, channel_type, channel_num, field):
         """Initialize the channel sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, model)
         self.entity_description = description
         self._channel_type = channel_type
         self._channel_num = channel_num
         self._field = field
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": model,
-            "manufacturer": "ARRIS",
-            "model": model,
-        }
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        channels = self.coordinator.data.get(self._channel_type, [])
-        for channel in channels:
-            if channel["channel"] == self._channel_num:
-                return channel.get(self._field)
-        return None
+        channel = self.coordinator.data["channel_index"][self._channel_type].get(
+            self._channel_num
+        )
+        if channel is None:
+            return None
+        return getattr(channel, self._field)
 
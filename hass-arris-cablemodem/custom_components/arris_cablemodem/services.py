@@ -0,0 +1,88 @@
+"""Services for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CHANNELS,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DIRECTION,
+    ATTR_FIELD,
+    ATTR_INCLUDE_VALUES,
+    ATTR_WINDOW,
+    DOMAIN,
+    SERVICE_GET_CHANNEL_HISTORY,
+)
+from .coordinator import ArrisDataUpdateCoordinator
+from .history import HISTORY_FIELDS
+
+GET_CHANNEL_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DIRECTION): vol.In(list(HISTORY_FIELDS)),
+        vol.Required(ATTR_FIELD): cv.string,
+        vol.Optional(ATTR_CHANNELS): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1))]
+        ),
+        vol.Optional(ATTR_WINDOW): cv.positive_time_period,
+        vol.Optional(ATTR_INCLUDE_VALUES, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_get_channel_history(call: ServiceCall) -> ServiceResponse:
+        """Summarize the recent history of a channel field from memory."""
+        coordinator = hass.data[DOMAIN].get(call.data[ATTR_CONFIG_ENTRY_ID])
+        if not isinstance(coordinator, ArrisDataUpdateCoordinator):
+            raise ServiceValidationError(
+                f"No loaded ARRIS modem with config entry ID "
+                f"{call.data[ATTR_CONFIG_ENTRY_ID]}"
+            )
+
+        direction = call.data[ATTR_DIRECTION]
+        field = call.data[ATTR_FIELD]
+        if field not in HISTORY_FIELDS[direction]:
+            raise ServiceValidationError(
+                f"No history of {field} for {direction} channels; "
+                f"use one of {', '.join(HISTORY_FIELDS[direction])}"
+            )
+
+        since = None
+        if (window := call.data.get(ATTR_WINDOW)) is not None:
+            since = (dt_util.utcnow() - window).timestamp()
+
+        channels = coordinator.history.query(
+            direction,
+            field,
+            call.data.get(ATTR_CHANNELS),
+            since,
+            call.data[ATTR_INCLUDE_VALUES],
+        )
+        return {
+            ATTR_DIRECTION: direction,
+            ATTR_FIELD: field,
+            ATTR_WINDOW: window.total_seconds() if window is not None else None,
+            ATTR_CHANNELS: {str(channel): result for channel, result in channels.items()},
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CHANNEL_HISTORY,
+        async_get_channel_history,
+        schema=GET_CHANNEL_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,122 @@
+"""In-memory poll statistics for ARRIS Surfboard Cable Modems."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+
+import aiohttp
+
+# Poll phases timed by the coordinator, in seconds:
+# poll    - the whole fetch as seen by the coordinator, including the wait
+#           for a free fetch slot in the fleet poller
+# fetch   - the HTTP request and reading the response body, excluding parsing
+# parse   - parsing the status page, which is done while it downloads
+# update  - writing entity states after new data arrived
+PHASES = ("poll", "fetch", "parse", "update")
+
+
+class RollingWindow:
+    """The most recent samples of a value, with nearest-rank percentiles."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize the window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return len(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        """Return the most recent sample."""
+        return self._samples[-1] if self._samples else None
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest once the window is full."""
+        self._samples.append(value)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the ``pct`` percentile of the samples, or None without any."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = round(pct / 100 * len(ordered))
+        return ordered[min(len(ordered) - 1, max(rank - 1, 0))]
+
+
+class PollStats:
+    """Per-phase timings, response sizes and failures of a modem's polls."""
+
+    def __init__(self, window: int) -> None:
+        """Initialize the statistics."""
+        self.timings = {phase: RollingWindow(window) for phase in PHASES}
+        self.response_size = RollingWindow(window)
+        self.polls = 0
+        self.failures = 0
+        self.failure_reasons: Counter[str] = Counter()
+        self.last_failure: str | None = None
+
+    def record_poll(
+        self, poll: float, fetch: float | None, parse: float | None, size: int | None
+    ) -> None:
+        """Record a successful fetch and the modem's own timings of it."""
+        self.polls += 1
+        self.timings["poll"].add(poll)
+        if fetch is not None:
+            self.timings["fetch"].add(fetch)
+        if parse is not None:
+            self.timings["parse"].add(parse)
+        if size is not None:
+            self.response_size.add(size)
+
+    def record_failure(self, err: Exception) -> None:
+        """Record a failed poll."""
+        self.polls += 1
+        self.failures += 1
+        self.last_failure = failure_reason(err)
+        self.failure_reasons[self.last_failure] += 1
+
+    def record_update(self, elapsed: float) -> None:
+        """Record how long writing entity states took."""
+        self.timings["update"].add(elapsed)
+
+    def timing_ms(self, phase: str) -> dict:
+        """Return the last, p50 and p95 timing of a phase in milliseconds."""
+        window = self.timings[phase]
+        return {
+            "samples": len(window),
+            "last": _ms(window.last),
+            "p50": _ms(window.percentile(50)),
+            "p95": _ms(window.percentile(95)),
+        }
+
+    def as_dict(self) -> dict:
+        """Return the statistics, with timings in milliseconds."""
+        return {
+            "polls": self.polls,
+            "failures": self.failures,
+            "last_failure": self.last_failure,
+            "failure_reasons": dict(self.failure_reasons),
+            "timings_ms": {phase: self.timing_ms(phase) for phase in PHASES},
+            "response_size": {
+                "last": self.response_size.last,
+                "p50": self.response_size.percentile(50),
+                "p95": self.response_size.percentile(95),
+            },
+        }
+
+
+def failure_reason(err: Exception) -> str:
+    """Return a short, stable description of why a poll failed."""
+    if isinstance(err, (asyncio.TimeoutError, TimeoutError)):
+        return "timeout"
+    if isinstance(err, aiohttp.ClientResponseError):
+        return f"http_{err.status}"
+    if isinstance(err, aiohttp.ClientConnectionError):
+        return "connection_error"
+    return type(err).__name__
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to milliseconds, rounded to 0.1 ms."""
+    return None if seconds is None else round(seconds * 1000, 1)
@@ -0,0 +1,30 @@
+"""Helpers shared by the development tools.
+
+The tools import it as a top-level module, so run them as modules from this
+directory:
+
+    python -m benchmarks.bench_parser
+    python -m replay.replay_captures captures/ out.parquet
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+COMPONENT = Path(__file__).resolve().parent / "custom_components" / "arris_cablemodem"
+
+
+def load_component_module(name: str) -> types.ModuleType:
+    """Import a module of the integration without Home Assistant.
+
+    The package ``__init__`` sets up the Home Assistant integration, so an
+    empty package is registered in its place and only ``name`` (and the
+    modules it imports) are loaded.
+    """
+    if "arris_cablemodem" not in sys.modules:
+        package = types.ModuleType("arris_cablemodem")
+        package.__path__ = [str(COMPONENT)]
+        sys.modules["arris_cablemodem"] = package
+    return importlib.import_module(f"arris_cablemodem.{name}")
@@ -0,0 +1,443 @@
+"""Stand-in ARRIS modems for load testing without hardware.
+
+Each emulated modem is an aiohttp server on its own port that serves a
+status page at ``/`` (the URL ``ArrisModem`` polls) for a configurable
+model and channel count. Signal levels drift and error counters climb
+between requests. Faults can be injected per modem:
+
+* latency: fixed delay plus random jitter before the response starts
+* slow drip: the body is sent in small chunks with a pause between them
+* truncation: the page is cut off part way through the markup
+* errors: HTTP 500/503 responses
+* resets: the connection is dropped without a response
+
+SURFboard modems also serve their event log at ``/RgEventLog.asp``; a new
+entry is logged now and then as the signal drifts.
+
+Gateways also serve the pages behind their login: the credentials
+(GATEWAY_USERNAME / GATEWAY_PASSWORD) are posted to ``/check.php`` (``.jst``
+on the TG3482G), which sets a session cookie for ``/network_setup.php`` and
+``/software.php``. Sessions can be made to expire after a number of seconds.
+
+Run standalone to poke at it with a browser or curl:
+
+    python loadtest/emulator.py --modems 3 --model SB6190 --downstream 32
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import secrets
+import time
+from dataclasses import dataclass
+
+from aiohttp import web
+
+SURFBOARD_MODELS = ("SB6183", "SB6190")
+GATEWAY_MODELS = ("TG1682G", "TG3482G")
+GATEWAY_USERNAME = "admin"
+GATEWAY_PASSWORD = "password"
+SESSION_COOKIE = "PHPSESSID"
+EVENT_LOG_SIZE = 50  # Entries kept, like the modem's own log
+EVENT_MESSAGES = (
+    ("Critical (3)", "No Ranging Response received - T3 time-out"),
+    ("Critical (3)", "Started Unicast Maintenance Ranging - No Response received - T3 time-out"),
+    ("Notice (6)", "TLV-11 - unrecognized OID"),
+    ("Warning (5)", "Dynamic Range Window violation"),
+)
+
+
+@dataclass
+class Faults:
+    """Fault injection settings of an emulated modem."""
+
+    latency: float = 0.0  # Seconds before the response starts
+    jitter: float = 0.0  # Extra random delay, up to this many seconds
+    drip_chunk: int = 0  # Bytes per chunk when dripping the body, 0 to disable
+    drip_delay: float = 0.0  # Seconds between dripped chunks
+    truncate_rate: float = 0.0  # Fraction of responses with truncated HTML
+    error_rate: float = 0.0  # Fraction of responses that are HTTP 5xx
+    reset_rate: float = 0.0  # Fraction of connections reset without a response
+
+
+class EmulatedModem:
+    """Serve the status page of one emulated modem."""
+
+    def __init__(
+        self,
+        model: str = "SB6183",
+        downstream: int = 16,
+        upstream: int = 4,
+        faults: Faults | None = None,
+        seed: int | None = None,
+        session_ttl: float = 0.0,
+    ) -> None:
+        """Initialize the modem.
+
+        Gateway sessions expire ``session_ttl`` seconds after login, or
+        never if it is 0.
+        """
+        self.model = model
+        self.faults = faults or Faults()
+        self.session_ttl = session_ttl
+        self.requests = 0
+        self.logins = 0
+        self._sessions: dict[str, float] = {}
+        self.events: list[tuple[str, str, str]] = [
+            ("Time Not Established", "Critical (3)", "No Ranging Response received - T3 time-out")
+        ] * 3
+        self._random = random.Random(seed)
+        self._downstream = [
+            {
+                "power": self._random.uniform(-4, 6),
+                "snr": self._random.uniform(36, 41),
+                "corrected": self._random.randint(0, 5000),
+                "uncorrectable": 0,
+            }
+            for _ in range(downstream)
+        ]
+        self._upstream = [
+            {"power": self._random.uniform(38, 48)} for _ in range(upstream)
+        ]
+        self._runner: web.AppRunner | None = None
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving and return the bound port."""
+        app = web.Application()
+        app.router.add_get("/", self._handle_status)
+        if self.model in SURFBOARD_MODELS:
+            app.router.add_get("/RgEventLog.asp", self._handle_event_log)
+        if self.model in GATEWAY_MODELS:
+            extension = ".jst" if self.model == "TG3482G" else ".php"
+            app.router.add_post(f"/check{extension}", self._handle_login)
+            app.router.add_get(f"/network_setup{extension}", self._handle_status)
+            app.router.add_get(f"/software{extension}", self._handle_software)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        """Start a session if the credentials match."""
+        form = await request.post()
+        response = web.HTTPFound("/at_a_glance.php")
+        if (form.get("username"), form.get("password")) != (
+            GATEWAY_USERNAME,
+            GATEWAY_PASSWORD,
+        ):
+            response.headers["Location"] = "/"
+            return response
+        self.logins += 1
+        session = secrets.token_hex(16)
+        self._sessions[session] = time.monotonic()
+        response.set_cookie(SESSION_COOKIE, session)
+        return response
+
+    def _logged_in(self, request: web.Request) -> bool:
+        """Return whether a request carries a live session cookie."""
+        started = self._sessions.get(request.cookies.get(SESSION_COOKIE, ""))
+        if started is None:
+            return False
+        if self.session_ttl and time.monotonic() - started > self.session_ttl:
+            return False
+        return True
+
+    async def _handle_event_log(self, request: web.Request) -> web.Response:
+        """Serve the event log page."""
+        self.requests += 1
+        rows = "".join(
+            f"<tr><td>{when}</td><td>{priority}</td><td>{description}</td></tr>"
+            for when, priority, description in self.events
+        )
+        return web.Response(
+            text=(
+                "<html><head><title>ARRIS Event Log</title></head><body>"
+                '<table class="simpleTable"><tr><th colspan="3"><strong>Event Log</strong></th></tr>'
+                "<tr><td><strong>Time</strong></td><td><strong>Priority</strong></td>"
+                f"<td><strong>Description</strong></td></tr>{rows}</table></body></html>"
+            ),
+            content_type="text/html",
+        )
+
+    async def _handle_software(self, request: web.Request) -> web.Response:
+        """Serve the software page with the product information."""
+        self.requests += 1
+        if not self._logged_in(request):
+            raise web.HTTPFound("/")
+        return web.Response(text=self._render_software(), content_type="text/html")
+
+    async def _handle_status(self, request: web.Request) -> web.StreamResponse:
+        """Serve the status page, applying the configured faults.
+
+        Behind a gateway's login the page is only served with a session.
+        """
+        self.requests += 1
+        if request.path != "/" and not self._logged_in(request):
+            raise web.HTTPFound("/")
+        faults = self.faults
+
+        if faults.latency or faults.jitter:
+            await asyncio.sleep(faults.latency + self._random.uniform(0, faults.jitter))
+
+        if self._random.random() < faults.reset_rate:
+            request.transport.abort()
+            raise asyncio.CancelledError
+
+        if self._random.random() < faults.error_rate:
+            return web.Response(status=self._random.choice((500, 503)))
+
+        self._drift()
+        body = self.render().encode()
+        if self._random.random() < faults.truncate_rate:
+            body = body[: self._random.randint(len(body) // 4, len(body) - 1)]
+
+        if not faults.drip_chunk:
+            return web.Response(body=body, content_type="text/html")
+
+        response = web.StreamResponse(headers={"Content-Type": "text/html"})
+        response.content_length = len(body)
+        await response.prepare(request)
+        try:
+            for offset in range(0, len(body), faults.drip_chunk):
+                await response.write(body[offset : offset + faults.drip_chunk])
+                await asyncio.sleep(faults.drip_delay)
+            await response.write_eof()
+        except ConnectionResetError:
+            # The client stopped reading once it had what it needed
+            pass
+        return response
+
+    def _drift(self) -> None:
+        """Move signal levels a little and advance the error counters."""
+        for channel in self._downstream:
+            channel["power"] += self._random.uniform(-0.2, 0.2)
+            channel["snr"] += self._random.uniform(-0.2, 0.2)
+            channel["corrected"] += self._random.randint(0, 20)
+            if self._random.random() < 0.05:
+                channel["uncorrectable"] += self._random.randint(1, 10)
+        for channel in self._upstream:
+            channel["power"] += self._random.uniform(-0.1, 0.1)
+        if self._random.random() < 0.05:
+            priority, description = self._random.choice(EVENT_MESSAGES)
+            when = time.strftime("%a %b %d %H:%M:%S %Y")
+            self.events = (self.events + [(when, priority, description)])[-EVENT_LOG_SIZE:]
+
+    def render(self) -> str:
+        """Render the current status page."""
+        if self.model in GATEWAY_MODELS:
+            return self._render_gateway()
+        return self._render_surfboard()
+
+    def _render_surfboard(self) -> str:
+        """Render a SURFboard (SB-series) status page."""
+        rows = [
+            f"<tr><td>{num}</td><td>Locked</td><td>QAM256</td><td>{12 + num}</td>"
+            f"<td>{549000000 + (num - 1) * 6000000} Hz</td>"
+            f"<td>{ch['power']:.1f} dBmV</td><td>{ch['snr']:.1f} dB</td>"
+            f"<td>{ch['corrected']}</td><td>{ch['uncorrectable']}</td></tr>"
+            for num, ch in enumerate(self._downstream, start=1)
+        ]
+        us_rows = [
+            f"<tr><td>{num}</td><td>Locked</td><td>ATDMA</td><td>{num}</td>"
+            f"<td>5120 kSym/s</td><td>{16400000 + (num - 1) * 6400000} Hz</td>"
+            f"<td>{ch['power']:.1f} dBmV</td></tr>"
+            for num, ch in enumerate(self._upstream, start=1)
+        ]
+        return (
+            "<!DOCTYPE html><html><head>"
+            f"<title>ARRIS SURFboard {self.model} Cable Modem : Status</title>"
+            '<script type="text/javascript">function refreshPage() {}</script>'
+            "</head><body>"
+            f'<div id="binnacle"><span id="thisModelNumberIs">{self.model}</span></div>'
+            '<table class="simpleTable"><tr><th colspan="3"><strong>Startup Procedure</strong></th></tr>'
+            "<tr><td><strong>Procedure</strong></td><td><strong>Status</strong></td><td><strong>Comment</strong></td></tr>"
+            "<tr><td>Acquire Downstream Channel</td><td>549000000 Hz</td><td>Locked</td></tr>"
+            "<tr><td>Connectivity State</td><td>OK</td><td>Operational</td></tr>"
+            "<tr><td>Boot State</td><td>OK</td><td>Operational</td></tr>"
+            "<tr><td>Configuration File</td><td>OK</td><td>&nbsp;</td></tr>"
+            "<tr><td>Security</td><td>Enabled</td><td>BPI+</td></tr></table>"
+            '<table class="simpleTable"><tr><th colspan="9"><strong>Downstream Bonded Channels</strong></th></tr>'
+            "<tr><td><strong>Channel</strong></td><td><strong>Lock Status</strong></td>"
+            "<td><strong>Modulation</strong></td><td><strong>Channel ID</strong></td>"
+            "<td><strong>Frequency</strong></td><td><strong>Power</strong></td><td><strong>SNR</strong></td>"
+            "<td><strong>Corrected</strong></td><td><strong>Uncorrectables</strong></td></tr>"
+            + "".join(rows)
+            + "</table>"
+            '<table class="simpleTable"><tr><th colspan="7"><strong>Upstream Bonded Channels</strong></th></tr>'
+            "<tr><td><strong>Channel</strong></td><td><strong>Lock Status</strong></td>"
+            "<td><strong>US Channel Type</strong></td><td><strong>Channel ID</strong></td>"
+            "<td><strong>Symbol Rate</strong></td><td><strong>Frequency</strong></td><td><strong>Power</strong></td></tr>"
+            + "".join(us_rows)
+            + "</table>"
+            '<div id="footer"><p>&copy; ARRIS Enterprises, LLC.</p></div>'
+            '<script type="text/javascript">setTimeout(refreshPage, 60000);</script>'
+            "</body></html>"
+        )
+
+    def _render_gateway(self) -> str:
+        """Render a TG-series gateway XFINITY Network page."""
+        count = len(self._downstream)
+
+        def table(title: str, rows: list[tuple[str, list[str]]], columns: int) -> str:
+            body = "".join(
+                f'<tr><th class="row-label">{label}</th>'
+                + "".join(f'<td><div class="netWidth">{cell}</div></td>' for cell in cells)
+                + "</tr>"
+                for label, cells in rows
+            )
+            return (
+                f'<div class="module"><table class="data"><thead><tr>'
+                f'<th colspan="{columns + 1}">{title}</th></tr></thead>'
+                f"<tbody>{body}</tbody></table></div>"
+            )
+
+        ds = self._downstream
+        us = self._upstream
+        return (
+            "<!DOCTYPE html><html><head><title>XFINITY</title></head><body>"
+            '<div class="module forms"><h2>Cable Modem</h2>'
+            f'<div class="form-row"><span class="readonlyLabel">Model:</span> <span class="value">{self.model}</span></div></div>'
+            '<div class="module forms"><h2>Initialization Procedure</h2>'
+            + "".join(
+                f'<div class="form-row"><span class="readonlyLabel">{step}:</span> <span class="value">Complete</span></div>'
+                for step in (
+                    "Initialize Hardware",
+                    "Acquire Downstream Channel",
+                    "Upstream Ranging",
+                    "DHCP bound",
+                    "Set Time-of-Day",
+                    "Configuration File Download",
+                    "Registration",
+                )
+            )
+            + "</div>"
+            + table(
+                "Downstream",
+                [
+                    ("Index", [str(num) for num in range(1, count + 1)]),
+                    ("Lock Status", ["Locked"] * count),
+                    ("Frequency", [f"{549 + num * 6} MHz" for num in range(count)]),
+                    ("SNR", [f"{ch['snr']:.1f} dB" for ch in ds]),
+                    ("Power Level", [f"{ch['power']:.1f} dBmV" for ch in ds]),
+                    ("Modulation", ["256 QAM"] * count),
+                ],
+                count,
+            )
+            + table(
+                "Upstream",
+                [
+                    ("Index", [str(num) for num in range(1, len(us) + 1)]),
+                    ("Lock Status", ["Locked"] * len(us)),
+                    ("Frequency", [f"{16.4 + num * 6.4:.1f} MHz" for num in range(len(us))]),
+                    ("Symbol Rate", ["5120"] * len(us)),
+                    ("Power Level", [f"{ch['power']:.1f} dBmV" for ch in us]),
+                    ("Modulation", ["64QAM"] * len(us)),
+                    ("Channel Type", ["ATDMA"] * len(us)),
+                ],
+                len(us),
+            )
+            + table(
+                "CM Error Codewords",
+                [
+                    ("Index", [str(num) for num in range(1, count + 1)]),
+                    ("Correctable Codewords", [str(ch["corrected"]) for ch in ds]),
+                    ("Uncorrectable Codewords", [str(ch["uncorrectable"]) for ch in ds]),
+                ],
+                count,
+            )
+            + '<div id="footer"><p>&copy; Comcast</p></div>'
+            '<script type="text/javascript">$(document).ready(function() {});</script>'
+            "</body></html>"
+        )
+
+
+    def _render_software(self) -> str:
+        """Render a TG-series gateway Software page."""
+        rows = (
+            ("eMTA &amp; DOCSIS Software Version", "10.1.27B.SIP.PC20.CT"),
+            ("Software Version", "10.1.27B.SIP.PC20.CT"),
+            ("Hardware Version", "1.0"),
+            ("Serial Number", "A1B2C3D4E5F6"),
+        )
+        return (
+            "<!DOCTYPE html><html><head><title>XFINITY</title></head><body>"
+            '<div class="module forms"><h2>System Software Version</h2>'
+            + "".join(
+                f'<div class="form-row"><span class="readonlyLabel">{label}:</span> '
+                f'<span class="value">{value}</span></div>'
+                for label, value in rows
+            )
+            + "</div></body></html>"
+        )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the emulator options to a command line parser."""
+    parser.add_argument("--modems", type=int, default=1, help="number of emulated modems")
+    parser.add_argument("--model", default="SB6183", choices=SURFBOARD_MODELS + GATEWAY_MODELS)
+    parser.add_argument("--downstream", type=int, default=16, help="downstream channels")
+    parser.add_argument("--upstream", type=int, default=4, help="upstream channels")
+    parser.add_argument("--base-port", type=int, default=0, help="first port, 0 for any free port")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay, seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay, seconds")
+    parser.add_argument("--drip-chunk", type=int, default=0, help="bytes per dripped chunk")
+    parser.add_argument("--drip-delay", type=float, default=0.0, help="seconds between chunks")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="truncated page fraction")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 5xx fraction")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="connection reset fraction")
+    parser.add_argument("--session-ttl", type=float, default=0.0, help="gateway session lifetime, seconds")
+
+
+async def async_start_modems(args: argparse.Namespace) -> list[tuple[EmulatedModem, int]]:
+    """Start the emulated modems described by the command line options."""
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        drip_chunk=args.drip_chunk,
+        drip_delay=args.drip_delay,
+        truncate_rate=args.truncate_rate,
+        error_rate=args.error_rate,
+        reset_rate=args.reset_rate,
+    )
+    modems = []
+    for index in range(args.modems):
+        modem = EmulatedModem(
+            args.model,
+            args.downstream,
+            args.upstream,
+            faults,
+            seed=index,
+            session_ttl=args.session_ttl,
+        )
+        port = await modem.async_start(port=args.base_port + index if args.base_port else 0)
+        modems.append((modem, port))
+    return modems
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve until interrupted."""
+    modems = await async_start_modems(args)
+    for modem, port in modems:
+        print(f"{modem.model} at http://127.0.0.1:{port}/")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for modem, _ in modems:
+            await modem.async_stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve emulated ARRIS modems.")
+    add_arguments(parser)
+    try:
+        asyncio.run(_async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
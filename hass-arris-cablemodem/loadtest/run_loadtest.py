@@ -0,0 +1,193 @@
+"""Load test the polling path against many emulated modems.
+
+Starts the emulated modems from ``emulator.py`` and sets each one up
+through ``async_setup_coordinator`` in the integration's ``__init__.py``,
+the same fleet poller, coordinator and modem path a config entry uses.
+The poller then runs for the requested duration, after which per-poll
+latency percentiles, failures, executor jobs, thread count and event loop
+lag are reported.
+
+    pip install homeassistant
+    python loadtest/run_loadtest.py --modems 50 --duration 120 --latency 0.2 --error-rate 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from emulator import (
+    GATEWAY_MODELS,
+    GATEWAY_PASSWORD,
+    GATEWAY_USERNAME,
+    EmulatedModem,
+    add_arguments,
+    async_start_modems,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.arris_cablemodem import async_setup_coordinator  # noqa: E402
+from custom_components.arris_cablemodem.const import (  # noqa: E402
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_MODEL,
+    DATA_POLLER,
+    DOMAIN,
+)
+
+
+def entry_data(modem: EmulatedModem, port: int, args: argparse.Namespace) -> dict:
+    """Return the config entry data of an emulated modem.
+
+    With ``--login``, gateways are set up with their credentials, so polls
+    go through the login and the pages behind it.
+    """
+    data = {CONF_HOST: f"127.0.0.1:{port}"}
+    if args.login and modem.model in GATEWAY_MODELS:
+        data.update(
+            {
+                CONF_MODEL: modem.model,
+                CONF_USERNAME: GATEWAY_USERNAME,
+                CONF_PASSWORD: GATEWAY_PASSWORD,
+            }
+        )
+    return data
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` (nearest rank)."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Run the load test."""
+    modems = await async_start_modems(args)
+    hass = HomeAssistant(tempfile.mkdtemp())
+    loop = asyncio.get_running_loop()
+
+    # Count executor jobs and sample threads and event loop lag
+    executor_jobs = 0
+    add_executor_job = hass.async_add_executor_job
+
+    def counting_add_executor_job(target, *job_args):
+        nonlocal executor_jobs
+        executor_jobs += 1
+        return add_executor_job(target, *job_args)
+
+    hass.async_add_executor_job = counting_add_executor_job
+    lags: list[float] = []
+    peak_threads = threading.active_count()
+
+    async def sample() -> None:
+        nonlocal peak_threads
+        while True:
+            start = loop.time()
+            await asyncio.sleep(0.1)
+            lags.append(loop.time() - start - 0.1)
+            peak_threads = max(peak_threads, threading.active_count())
+
+    sampler = asyncio.create_task(sample())
+
+    entries = [
+        ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title=f"{modem.model} (127.0.0.1:{port})",
+            data=entry_data(modem, port, args),
+            source="user",
+            options={
+                CONF_MIN_INTERVAL: args.min_interval,
+                CONF_MAX_INTERVAL: args.max_interval,
+            },
+        )
+        for modem, port in modems
+    ]
+
+    # Time every fetch the poller makes, including waits for a fetch slot
+    latencies: list[float] = []
+    failures = 0
+    coordinators = []
+    started = time.monotonic()
+    for entry in entries:
+        try:
+            coordinators.append(await async_setup_coordinator(hass, entry))
+        except Exception as err:  # noqa: BLE001
+            failures += 1
+            print(f"Setup of {entry.title} failed: {err!r}")
+    poller = hass.data[DOMAIN][DATA_POLLER]
+    fetch = poller.async_fetch
+
+    async def timed_fetch(modem):
+        nonlocal failures
+        start = loop.time()
+        try:
+            return await fetch(modem)
+        except Exception:
+            failures += 1
+            raise
+        finally:
+            latencies.append(loop.time() - start)
+
+    poller.async_fetch = timed_fetch
+    print(f"Set up {len(coordinators)} modems in {time.monotonic() - started:.2f}s")
+
+    await asyncio.sleep(args.duration)
+
+    sampler.cancel()
+    for entry in entries:
+        poller.async_remove(entry.entry_id)
+    for modem, _ in modems:
+        await modem.async_stop()
+    await hass.async_stop(force=True)
+
+    print(f"Polls:           {len(latencies)} ({failures} failed)")
+    if latencies:
+        print(
+            "Latency (ms):    "
+            f"p50 {percentile(latencies, 50) * 1000:.1f}  "
+            f"p90 {percentile(latencies, 90) * 1000:.1f}  "
+            f"p99 {percentile(latencies, 99) * 1000:.1f}  "
+            f"max {max(latencies) * 1000:.1f}  "
+            f"mean {statistics.fmean(latencies) * 1000:.1f}"
+        )
+    if args.login:
+        print(f"Logins:          {sum(modem.logins for modem, _ in modems)}")
+    print(f"Executor jobs:   {executor_jobs}")
+    print(f"Peak threads:    {peak_threads}")
+    if lags:
+        print(
+            "Loop lag (ms):   "
+            f"p50 {percentile(lags, 50) * 1000:.1f}  "
+            f"p99 {percentile(lags, 99) * 1000:.1f}  "
+            f"max {max(lags) * 1000:.1f}"
+        )
+
+
+def main() -> None:
+    """Parse the command line and run the load test."""
+    parser = argparse.ArgumentParser(description="Load test the ARRIS polling path.")
+    add_arguments(parser)
+    parser.add_argument("--duration", type=float, default=60, help="seconds to poll for")
+    parser.add_argument("--min-interval", type=int, default=5, help="minimum poll interval")
+    parser.add_argument("--max-interval", type=int, default=5, help="maximum poll interval")
+    parser.add_argument("--login", action="store_true", help="poll gateways through their login")
+    parser.add_argument("--debug", action="store_true", help="log integration debug output")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.CRITICAL)
+    asyncio.run(async_run(args))
+
+
+if __name__ == "__main__":
+    main()
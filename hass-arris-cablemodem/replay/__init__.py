@@ -0,0 +1 @@
+"""Offline replay of archived modem status pages."""
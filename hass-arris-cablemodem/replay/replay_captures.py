@@ -0,0 +1,266 @@
+"""Parse archived modem status pages in bulk, without Home Assistant.
+
+Reads every capture (``*.html``, ``*.htm``, optionally gzipped) from a
+directory tree or a tarball and parses it in a pool of worker processes
+with the integration's own ``ArrisModem.parse_status``. Rows are written
+as they arrive, one per channel per capture, to a Parquet file when
+``pyarrow`` is installed and to a gzipped CSV file otherwise.
+
+Captures are read lazily and only a few per worker are in flight at any
+time, so memory use does not grow with the size of the archive. A tarball
+is read as a stream, and compressed ones are decompressed on the fly.
+
+    python -m replay.replay_captures captures/ out.parquet
+    python -m replay.replay_captures captures-2024.tar.gz out.csv.gz --workers 8
+
+Each capture is timestamped with its file's modification time. Pages that
+fail to parse, or yield no channels, are counted and reported at the end.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import os
+import sys
+import tarfile
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from devtools import load_component_module
+
+SUFFIXES = (".html", ".htm", ".html.gz", ".htm.gz")
+
+# Output columns; fields a direction does not have are left empty
+COLUMNS = (
+    ("capture", "string"),
+    ("captured_at", "timestamp"),
+    ("model", "string"),
+    ("direction", "string"),
+    ("channel", "int"),
+    ("lock_status", "string"),
+    ("modulation", "string"),
+    ("channel_type", "string"),
+    ("channel_id", "int"),
+    ("symbol_rate", "string"),
+    ("frequency", "int"),
+    ("power", "float"),
+    ("snr", "float"),
+    ("corrected", "int"),
+    ("uncorrectable", "int"),
+)
+CHANNEL_FIELDS = tuple(name for name, _ in COLUMNS[4:])
+
+# Rows buffered before they are written out as one Parquet row group
+BATCH_ROWS = 65536
+
+_modem_module = None
+
+
+def is_capture(name: str) -> bool:
+    """Return whether a file name looks like a saved status page."""
+    return name.lower().endswith(SUFFIXES)
+
+
+def iter_directory(root: Path) -> Iterator[tuple[str, float, Path]]:
+    """Yield ``(name, mtime, path)`` for every capture below ``root``.
+
+    Workers read the files themselves, so only paths pass between processes.
+    """
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and is_capture(path.name):
+            yield str(path.relative_to(root)), path.stat().st_mtime, path
+
+
+def iter_tarball(path: Path) -> Iterator[tuple[str, float, bytes]]:
+    """Yield ``(name, mtime, body)`` for every capture in a tarball.
+
+    The archive is read as a stream, one member at a time.
+    """
+    with tarfile.open(path, "r|*") as archive:
+        for member in archive:
+            if member.isfile() and is_capture(member.name):
+                yield member.name, member.mtime, archive.extractfile(member).read()
+
+
+def parse_capture(
+    name: str, mtime: float, source: Path | bytes, model: str | None, encoding: str
+) -> tuple[str, list[tuple] | None]:
+    """Parse one capture in a worker process.
+
+    Returns the capture name and its rows, or None if the page could not be
+    parsed at all.
+    """
+    global _modem_module  # noqa: PLW0603
+    if _modem_module is None:
+        _modem_module = load_component_module("modem")
+
+    body = source.read_bytes() if isinstance(source, Path) else source
+    if name.lower().endswith(".gz"):
+        body = gzip.decompress(body)
+    # A new modem per capture, so the model detected for one page is not
+    # applied to the next
+    modem = _modem_module.ArrisModem("replay", model=model)
+    try:
+        status = modem.parse_status(body.decode(encoding, errors="replace"))
+    except Exception:  # noqa: BLE001
+        return name, None
+
+    captured_at = datetime.fromtimestamp(mtime, timezone.utc)
+    return name, [
+        (name, captured_at, status["model"], direction)
+        + tuple(channel.get(field) for field in CHANNEL_FIELDS)
+        for direction in ("downstream", "upstream")
+        for channel in status[direction]
+    ]
+
+
+class CsvWriter:
+    """Write rows to a gzipped CSV file."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the output file."""
+        self._file = gzip.open(path, "wt", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(name for name, _ in COLUMNS)
+
+    def write(self, rows: list[tuple]) -> None:
+        """Write rows."""
+        self._writer.writerows(
+            (row[0], row[1].isoformat(), *row[2:]) for row in rows
+        )
+
+    def close(self) -> None:
+        """Close the output file."""
+        self._file.close()
+
+
+class ParquetWriter:
+    """Write rows to a Parquet file, one row group per batch."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the output file."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {
+            "string": pa.string(),
+            "timestamp": pa.timestamp("s", tz="UTC"),
+            "int": pa.int64(),
+            "float": pa.float64(),
+        }
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind in COLUMNS])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+        self._rows: list[tuple] = []
+
+    def write(self, rows: list[tuple]) -> None:
+        """Buffer rows, writing a row group once a batch is full."""
+        self._rows.extend(rows)
+        if len(self._rows) >= BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the buffered rows as a row group."""
+        if not self._rows:
+            return
+        columns = [list(column) for column in zip(*self._rows)]
+        self._writer.write_table(
+            self._pa.Table.from_arrays(columns, schema=self._schema)
+        )
+        self._rows = []
+
+    def close(self) -> None:
+        """Write the remaining rows and close the output file."""
+        self._flush()
+        self._writer.close()
+
+
+def open_writer(path: Path) -> CsvWriter | ParquetWriter:
+    """Return the writer for an output path."""
+    if path.suffix == ".parquet":
+        try:
+            return ParquetWriter(path)
+        except ImportError:
+            sys.exit("Writing Parquet requires pyarrow; pip install pyarrow or use .csv.gz")
+    if path.name.endswith(".csv.gz"):
+        return CsvWriter(path)
+    sys.exit(f"Unknown output format for {path}; use .parquet or .csv.gz")
+
+
+def default_output() -> str:
+    """Return Parquet if pyarrow is installed, gzipped CSV otherwise."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "replay.csv.gz"
+    return "replay.parquet"
+
+
+def main() -> int:
+    """Run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="directory or tarball of captures")
+    parser.add_argument(
+        "output", type=Path, nargs="?", default=None,
+        help="output file, .parquet or .csv.gz (default: %s)" % default_output(),
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--model", help="parse every capture as this model instead of detecting it")
+    parser.add_argument("--encoding", default="utf-8", help="encoding of the captures")
+    args = parser.parse_args()
+    output = args.output or Path(default_output())
+
+    if args.source.is_dir():
+        captures = iter_directory(args.source)
+    elif tarfile.is_tarfile(args.source):
+        captures = iter_tarball(args.source)
+    else:
+        sys.exit(f"{args.source} is neither a directory nor a tarball")
+
+    writer = open_writer(output)
+    parsed = rows = empty = 0
+    failed = []
+    started = time.perf_counter()
+
+    # Keep a bounded window of captures in flight and collect results in
+    # order, so neither the input nor the output piles up in memory
+    with ProcessPoolExecutor(args.workers) as pool:
+        pending: deque[Future] = deque()
+
+        def collect() -> None:
+            nonlocal parsed, rows, empty
+            name, capture_rows = pending.popleft().result()
+            if capture_rows is None:
+                failed.append(name)
+                return
+            parsed += 1
+            rows += len(capture_rows)
+            empty += not capture_rows
+            writer.write(capture_rows)
+
+        for name, mtime, source in captures:
+            pending.append(
+                pool.submit(parse_capture, name, mtime, source, args.model, args.encoding)
+            )
+            if len(pending) >= args.workers * 4:
+                collect()
+        while pending:
+            collect()
+
+    writer.close()
+    elapsed = time.perf_counter() - started
+    print(f"Parsed {parsed} captures into {rows} rows in {elapsed:.1f}s -> {output}")
+    if empty:
+        print(f"{empty} captures had no channels")
+    for name in failed:
+        print(f"FAILED {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
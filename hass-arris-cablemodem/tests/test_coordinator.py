@@ -0,0 +1,214 @@
+"""Tests for the ARRIS data update coordinator."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.arris_cablemodem import async_remove_entry, sensor
+from custom_components.arris_cablemodem.const import (
+    ANOMALY_WARMUP,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY,
+)
+from custom_components.arris_cablemodem.coordinator import (
+    ArrisDataUpdateCoordinator,
+    build_snapshot,
+)
+from custom_components.arris_cablemodem.modem import ArrisModem
+from custom_components.arris_cablemodem.models import DownstreamChannel
+
+
+def _status(uncorrectable: int) -> dict:
+    """Return a parsed status with one downstream channel."""
+    return {
+        "model": "SB6183",
+        "startup": {},
+        "downstream": [
+            DownstreamChannel(
+                channel=1,
+                lock_status="Locked",
+                modulation="QAM256",
+                channel_id=1,
+                frequency=555000000,
+                power=1.0,
+                snr=40.0,
+                corrected=0,
+                uncorrectable=uncorrectable,
+            )
+        ],
+        "upstream": [],
+    }
+
+
+async def test_error_spike_clears_on_unchanged_page(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """An error spike ends once the page stops changing."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    poller = MagicMock()
+    poller.async_fetch_event_log = AsyncMock(return_value=None)
+    coordinator = ArrisDataUpdateCoordinator(
+        hass, poller, ArrisModem("192.168.100.1"), entry
+    )
+
+    for _ in range(ANOMALY_WARMUP):
+        poller.async_fetch = AsyncMock(return_value=_status(0))
+        coordinator.data = await coordinator._async_update_data()
+        freezer.tick(timedelta(minutes=1))
+
+    # The modem returns the same status object while its page is unchanged
+    spike = _status(1000)
+    poller.async_fetch = AsyncMock(return_value=spike)
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["anomalies"]["error_spike"]
+
+    freezer.tick(timedelta(minutes=1))
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["anomalies"]["error_spike"] == []
+
+    # Nothing changed since: the data object is kept
+    data = coordinator.data
+    freezer.tick(timedelta(minutes=1))
+    assert await coordinator._async_update_data() is data
+
+
+
+
+async def test_counter_reset_is_kept(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A modem restart is remembered after the poll that noticed it."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    poller = MagicMock()
+    poller.async_fetch_event_log = AsyncMock(return_value=None)
+    coordinator = ArrisDataUpdateCoordinator(
+        hass, poller, ArrisModem("192.168.100.1"), entry
+    )
+    (description,) = [
+        description
+        for description in sensor.SENSOR_TYPES
+        if description.key == "ds_counter_reset"
+    ]
+
+    poller.async_fetch = AsyncMock(return_value=_status(500))
+    coordinator.data = await coordinator._async_update_data()
+    assert description.value_fn(coordinator.data) is None
+
+    freezer.tick(timedelta(minutes=1))
+    reset_at = dt_util.utcnow()
+    poller.async_fetch = AsyncMock(return_value=_status(3))
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["anomalies"]["counter_reset"]
+
+    freezer.tick(timedelta(minutes=1))
+    poller.async_fetch = AsyncMock(return_value=_status(4))
+    coordinator.data = await coordinator._async_update_data()
+    assert not coordinator.data["anomalies"]["counter_reset"]
+    assert description.value_fn(coordinator.data) == reset_at
+async def test_event_log_does_not_hold_up_refresh(hass: HomeAssistant) -> None:
+    """The event log is read in the background and cancelled on unload."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    poller = MagicMock()
+    poller.async_fetch = AsyncMock(return_value=_status(0))
+    read = asyncio.Event()
+
+    async def async_fetch_event_log(modem: ArrisModem) -> None:
+        read.set()
+        await asyncio.Event().wait()
+
+    poller.async_fetch_event_log = async_fetch_event_log
+    coordinator = ArrisDataUpdateCoordinator(
+        hass, poller, ArrisModem("192.168.100.1"), entry
+    )
+
+    async with asyncio.timeout(1):
+        assert await coordinator._async_update_data()
+        await read.wait()
+
+    (task,) = entry._background_tasks
+    await entry._async_process_on_unload(hass)
+    assert task.cancelled()
+
+
+async def test_removed_entry_leaves_no_snapshot(
+    hass: HomeAssistant, hass_storage: dict, freezer: FrozenDateTimeFactory
+) -> None:
+    """A delayed snapshot save does not write after the entry is removed."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    poller = MagicMock()
+    poller.async_fetch = AsyncMock(return_value=_status(0))
+    poller.async_fetch_event_log = AsyncMock(return_value=None)
+    coordinator = ArrisDataUpdateCoordinator(
+        hass, poller, ArrisModem("192.168.100.1"), entry
+    )
+    coordinator.data = await coordinator._async_update_data()
+    key = STORAGE_KEY.format(entry.entry_id)
+    assert key not in hass_storage
+
+    await coordinator.async_shutdown()
+    assert hass_storage[key]["data"]["model"] == "SB6183"
+    await async_remove_entry(hass, entry)
+    assert key not in hass_storage
+
+    freezer.tick(timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert key not in hass_storage
+
+
+def test_snapshot_summary() -> None:
+    """The snapshot indexes the channels and aggregates each direction."""
+    channels = [
+        DownstreamChannel(
+            channel=number,
+            lock_status="Locked",
+            modulation="QAM256",
+            channel_id=number,
+            frequency=555000000,
+            power=power,
+            snr=snr,
+            corrected=corrected,
+            uncorrectable=uncorrectable,
+        )
+        for number, power, snr, corrected, uncorrectable in (
+            (1, 1.0, 40.0, 10, 1),
+            (2, -2.5, 38.5, 0, 2),
+            (3, 4.0, 36.2, 5, 3),
+        )
+    ]
+    snapshot = build_snapshot(
+        {"model": "SB6183", "startup": {}, "downstream": channels, "upstream": []}
+    )
+
+    assert snapshot["channel_index"]["downstream"][2] is channels[1]
+    assert snapshot["channel_index"]["upstream"] == {}
+    assert snapshot["summary"]["downstream"] == {
+        "count": 3,
+        "avg_power": 0.8,
+        "min_power": -2.5,
+        "max_power": 4.0,
+        "power_spread": 6.5,
+        "avg_snr": 38.2,
+        "min_snr": 36.2,
+        "max_snr": 40.0,
+        "snr_spread": 3.8,
+        "total_corrected": 15,
+        "total_uncorrectable": 6,
+    }
+    assert snapshot["summary"]["upstream"] == {
+        "count": 0,
+        "avg_power": None,
+        "min_power": None,
+        "max_power": None,
+        "power_spread": None,
+    }
@@ -0,0 +1,132 @@
+"""Tests for the in-memory channel history and its service."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.arris_cablemodem.const import (
+    DOMAIN,
+    SERVICE_GET_CHANNEL_HISTORY,
+)
+from custom_components.arris_cablemodem.coordinator import ArrisDataUpdateCoordinator
+from custom_components.arris_cablemodem.history import ChannelHistory
+from custom_components.arris_cablemodem.modem import ArrisModem
+from custom_components.arris_cablemodem.models import DownstreamChannel
+from custom_components.arris_cablemodem.services import async_setup_services
+
+
+def _status(*snrs: tuple[int, float]) -> dict:
+    """Return a parsed status with a downstream channel per (channel, snr)."""
+    return {
+        "downstream": [
+            DownstreamChannel(
+                channel=channel,
+                lock_status="Locked",
+                modulation="QAM256",
+                channel_id=channel,
+                frequency=555000000,
+                power=1.0,
+                snr=snr,
+                corrected=0,
+                uncorrectable=0,
+            )
+            for channel, snr in snrs
+        ],
+        "upstream": [],
+    }
+
+
+def test_ring_buffer() -> None:
+    """The oldest polls are overwritten and missing channels leave gaps."""
+    history = ChannelHistory(3)
+    history.record(100.0, _status((1, 40.0), (2, 38.0)))
+    history.record(200.0, _status((1, 39.0)))
+    history.record(300.0, _status((1, 37.0), (2, 36.0)))
+    history.record(400.0, _status((1, 35.0), (2, 35.5)))
+
+    assert len(history) == 3
+    assert history.channels("downstream", "snr") == [1, 2]
+
+    result = history.query("downstream", "snr", include_values=True)
+    assert result[1] == {
+        "samples": 3,
+        "min": 35.0,
+        "max": 39.0,
+        "mean": 37.0,
+        "first": 39.0,
+        "last": 35.0,
+        "delta": -4.0,
+        "timestamps": [200.0, 300.0, 400.0],
+        "values": [39.0, 37.0, 35.0],
+    }
+    assert result[2]["timestamps"] == [300.0, 400.0]
+
+    result = history.query("downstream", "snr", [2], since=350.0)
+    assert list(result) == [2]
+    assert result[2]["samples"] == 1
+    assert result[2]["delta"] == 0.0
+
+
+async def test_get_channel_history_service(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """The service summarizes a loaded modem's history over a window."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    coordinator = ArrisDataUpdateCoordinator(
+        hass, MagicMock(), ArrisModem("192.168.100.1"), entry
+    )
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    async_setup_services(hass)
+
+    now = dt_util.utcnow().timestamp()
+    coordinator.history.record(now - 600, _status((1, 40.0)))
+    coordinator.history.record(now - 60, _status((1, 38.0)))
+    coordinator.history.record(now, _status((1, 37.0)))
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_CHANNEL_HISTORY,
+        {
+            "config_entry_id": entry.entry_id,
+            "direction": "downstream",
+            "field": "snr",
+            "window": {"minutes": 5},
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response["window"] == 300
+    assert response["channels"]["1"]["samples"] == 2
+    assert response["channels"]["1"]["delta"] == -1.0
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_CHANNEL_HISTORY,
+            {
+                "config_entry_id": entry.entry_id,
+                "direction": "upstream",
+                "field": "snr",
+            },
+            blocking=True,
+            return_response=True,
+        )
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_CHANNEL_HISTORY,
+            {
+                "config_entry_id": "missing",
+                "direction": "downstream",
+                "field": "snr",
+            },
+            blocking=True,
+            return_response=True,
+        )
@@ -0,0 +1,66 @@
+"""Tests for the cost of importing the integration."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from benchmarks.bench_import import (
+    BASELINE,
+    COMPONENT,
+    HEAVY_MODULES,
+    MODULES,
+    home_assistant_imports,
+)
+
+# Allowed slowdown against the stored baseline; generous, since a single
+# test run is noisier than the benchmark's median
+TIME_TOLERANCE = 2.0
+
+CHILD = """
+import importlib, json, sys, time
+import homeassistant.bootstrap
+for name in {preload!r}:
+    importlib.import_module(name)
+sys.path.insert(0, {root!r})
+loaded = set(sys.modules)
+start = time.perf_counter()
+for module in {modules!r}:
+    importlib.import_module("custom_components.arris_cablemodem" + module)
+print(json.dumps({{
+    "total": (time.perf_counter() - start) * 1000,
+    "heavy": sorted(
+        name for name in set(sys.modules) - loaded
+        if name.split(".")[0] in {heavy!r}
+    ),
+}}))
+"""
+
+
+def _import_integration() -> dict:
+    """Import the integration and its platforms in a fresh interpreter."""
+    script = CHILD.format(
+        preload=home_assistant_imports(),
+        root=str(COMPONENT.parents[1]),
+        modules=MODULES,
+        heavy=HEAVY_MODULES,
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_is_light() -> None:
+    """Importing the integration loads none of the heavy dependencies.
+
+    Home Assistant may already have loaded some of them (the update
+    coordinator imports requests), so only modules the integration's own
+    import adds are counted.
+    """
+    rounds = [_import_integration() for _ in range(3)]
+    assert rounds[0]["heavy"] == []
+
+    baseline = json.loads(BASELINE.read_text())["total"]
+    fastest = min(result["total"] for result in rounds)
+    assert fastest <= baseline * (1 + TIME_TOLERANCE)
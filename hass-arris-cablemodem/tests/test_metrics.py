@@ -0,0 +1,68 @@
+"""Tests for the OpenMetrics endpoint."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.arris_cablemodem.const import CONF_METRICS, DOMAIN
+from custom_components.arris_cablemodem.coordinator import (
+    ArrisDataUpdateCoordinator,
+    build_snapshot,
+)
+from custom_components.arris_cablemodem.metrics import ArrisMetricsView
+from custom_components.arris_cablemodem.modem import ArrisModem
+from custom_components.arris_cablemodem.models import DownstreamChannel
+
+
+async def test_metrics_follow_the_snapshot(hass: HomeAssistant) -> None:
+    """Samples are rendered from the snapshot and cached until it changes."""
+    entry = MockConfigEntry(domain=DOMAIN, options={CONF_METRICS: True})
+    coordinator = ArrisDataUpdateCoordinator(
+        hass, MagicMock(), ArrisModem("192.168.100.1"), entry
+    )
+    coordinator.config_entry = entry
+    coordinator.data = build_snapshot(
+        {
+            "model": "SB6183",
+            "startup": {"boot": "OK"},
+            "downstream": [
+                DownstreamChannel(
+                    channel=1,
+                    lock_status="Locked",
+                    modulation="QAM256",
+                    channel_id=17,
+                    frequency=555000000,
+                    power=1.5,
+                    snr=40.0,
+                    corrected=10,
+                    uncorrectable=2,
+                )
+            ],
+            "upstream": [],
+        }
+    )
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    view = ArrisMetricsView(hass)
+
+    response = await view.get(MagicMock())
+    lines = response.body.decode().splitlines()
+    assert 'arris_up{host="192.168.100.1",model="SB6183"} 1' in lines
+    assert (
+        'arris_downstream_snr_db{host="192.168.100.1",channel="1",'
+        'channel_id="17",frequency="555000000"} 40.0'
+    ) in lines
+    assert (
+        'arris_downstream_uncorrectable_codewords_total{host="192.168.100.1",'
+        'channel="1",channel_id="17",frequency="555000000"} 2'
+    ) in lines
+    assert 'arris_startup_info{host="192.168.100.1",step="boot",status="OK"} 1' in lines
+    assert lines[-1] == "# EOF"
+
+    assert (await view.get(MagicMock())).body is response.body
+
+    coordinator.last_update_success = False
+    lines = (await view.get(MagicMock())).body.decode().splitlines()
+    assert 'arris_up{host="192.168.100.1",model="SB6183"} 0' in lines
+    assert not any(line.startswith("arris_downstream") for line in lines)
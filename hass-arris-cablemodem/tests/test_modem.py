@@ -0,0 +1,39 @@
+"""Tests for reading the status from the modem."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+from custom_components.arris_cablemodem.modem import ArrisModem
+
+CAPTURES = Path(__file__).resolve().parents[1] / "benchmarks" / "captures"
+
+
+async def test_unchanged_status_is_the_cached_object(
+    aiohttp_server, socket_enabled
+) -> None:
+    """The same status object is returned while the parsed values stay."""
+    html = (CAPTURES / "sb6183_8ch.html").read_text()
+    pages = [html, html, html.replace("</html>", "<!-- 12:00 --></html>")]
+    pages.append(pages[-1].replace("40.2 dB", "35.2 dB"))
+
+    async def status_page(request: web.Request) -> web.Response:
+        return web.Response(text=pages.pop(0), content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", status_page)
+    server = await aiohttp_server(app)
+
+    async with aiohttp.ClientSession() as session:
+        modem = ArrisModem(f"{server.host}:{server.port}", session)
+        first = await modem.async_get_status()
+        assert await modem.async_get_status() is first
+        # Markup that holds no status does not change it
+        assert await modem.async_get_status() is first
+        changed = await modem.async_get_status()
+        modem.async_close()
+
+    assert changed is not first
+    assert changed["downstream"][0].snr == 35.2
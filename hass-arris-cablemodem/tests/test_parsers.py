@@ -0,0 +1,94 @@
+"""Tests for the model-specific status page parsers."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from custom_components.arris_cablemodem.modem import ArrisModem
+from custom_components.arris_cablemodem.parsers import (
+    GENERIC_PARSER,
+    gateway,
+    get_parser,
+    has_parser,
+    surfboard,
+)
+
+CAPTURES = Path(__file__).resolve().parents[1] / "benchmarks" / "captures"
+EXPECTED = Path(__file__).resolve().parent / "fixtures" / "status"
+
+
+@pytest.mark.parametrize(
+    "capture", sorted(CAPTURES.glob("*.html")), ids=lambda path: path.stem
+)
+def test_parse_status_matches_expected(capture: Path) -> None:
+    """Every capture parses to the stored output.
+
+    The SurfBoard outputs were recorded with the BeautifulSoup parser the
+    single-pass parser replaced, the gateway outputs with the gateway parser.
+    """
+    status = ArrisModem("192.168.100.1").parse_status(capture.read_text())
+    for direction in ("downstream", "upstream"):
+        status[direction] = [channel.as_dict() for channel in status[direction]]
+    assert status == json.loads((EXPECTED / f"{capture.stem}.json").read_text())
+
+
+@pytest.mark.parametrize(
+    "capture", sorted(CAPTURES.glob("sb*.html")), ids=lambda path: path.stem
+)
+def test_event_log_path_matches_capture(capture: Path) -> None:
+    """The event log is read from the page the modem's menu links to."""
+    html = capture.read_text()
+    model = get_parser(None).parse(html)["model"]
+    parser = get_parser(model)
+    assert f'href="{parser.event_log_path(model).lstrip("/")}"' in html
+
+
+def test_parse_event_log() -> None:
+    """Entries are read oldest first; a page without the table is an error."""
+    parser = get_parser("SB6183")
+    entries = parser.parse_event_log(
+        '<table class="simpleTable"><tr><th colspan="3">Event Log</th></tr>'
+        "<tr><td>Time</td><td>Priority</td><td>Description</td></tr>"
+        "<tr><td>Mon Jan 01 00:00:00 2024</td><td>Critical (3)</td>"
+        "<td>No Ranging Response received - T3 time-out</td></tr>"
+        "<tr><td>Mon Jan 01 00:05:00 2024</td><td>Notice (6)</td>"
+        "<td>Honoring MDD; IP provisioning mode = IPv6</td></tr></table>"
+    )
+    assert [entry.priority for entry in entries] == ["Critical (3)", "Notice (6)"]
+    with pytest.raises(ValueError):
+        parser.parse_event_log("<html><body>Not Found</body></html>")
+
+
+def test_parser_registry() -> None:
+    """Known models get their own parser, anything else the generic one."""
+    assert get_parser("SB6190") is surfboard
+    assert get_parser("TG3482G") is gateway
+    assert get_parser("SB9999") is GENERIC_PARSER
+    assert get_parser(None) is GENERIC_PARSER
+    assert has_parser("TG1682G")
+    assert not has_parser("SB9999")
+    assert not has_parser(None)
+
+
+def test_detected_model_is_remembered() -> None:
+    """Only models with their own parser are remembered.
+
+    A remembered model is detected again when its parser finds no channels.
+    """
+    modem = ArrisModem("192.168.100.1")
+    modem.parse_status((CAPTURES / "sb6190_16ch.html").read_text())
+    assert modem.model == "SB6190"
+
+    # The modem was swapped for a gateway
+    status = modem.parse_status((CAPTURES / "tg3482g_32ch.html").read_text())
+    assert modem.model == "TG3482G"
+    assert len(status["downstream"]) == 32
+
+    modem = ArrisModem("192.168.100.1")
+    html = (CAPTURES / "sb6183_8ch.html").read_text().replace("SB6183", "SB9999")
+    status = modem.parse_status(html)
+    assert status["model"] == "SB9999"
+    assert len(status["downstream"]) == 8
+    assert modem.model is None
@@ -0,0 +1,125 @@
+"""Tests for the shared fleet poller."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.arris_cablemodem.const import FLEET_MAX_CONCURRENT_FETCHES
+from custom_components.arris_cablemodem.poller import ArrisFleetPoller
+
+INTERVAL = 10
+
+
+def _coordinator() -> MagicMock:
+    """Return a stand-in coordinator that counts its refreshes."""
+    coordinator = MagicMock(min_interval=INTERVAL, poll_interval=INTERVAL)
+    coordinator.refreshes = 0
+
+    async def async_refresh() -> None:
+        coordinator.refreshes += 1
+
+    coordinator.async_refresh = async_refresh
+    return coordinator
+
+
+async def _advance(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: int
+) -> None:
+    """Move time forward one second at a time, running due polls."""
+    for _ in range(seconds):
+        freezer.tick(timedelta(seconds=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+
+async def test_reload_during_poll(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A poll still running when its entry is reloaded does not reschedule."""
+    poller = ArrisFleetPoller(hass)
+    poller.async_add_modem("entry", "192.168.100.1")
+    old = _coordinator()
+    release = asyncio.Event()
+
+    async def async_slow_refresh() -> None:
+        old.refreshes += 1
+        await release.wait()
+
+    old.async_refresh = async_slow_refresh
+    poller.async_start("entry", old, 0)
+    # The poll blocks on the refresh, so only let it start
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert old.refreshes == 1
+
+    # Reloaded while the poll is in flight
+    poller.async_remove("entry")
+    poller.async_add_modem("entry", "192.168.100.1")
+    new = _coordinator()
+    poller.async_start("entry", new)
+    release.set()
+    await hass.async_block_till_done()
+
+    await _advance(hass, freezer, 10 * INTERVAL)
+    assert old.refreshes == 1
+    assert 9 <= new.refreshes <= 11
+    poller.async_remove("entry")
+
+
+async def test_fetch_budget_starts_with_the_slot(hass: HomeAssistant) -> None:
+    """Modems waiting for a slot held by hung modems still get their budget."""
+    poller = ArrisFleetPoller(hass)
+    hung = MagicMock()
+    hung.async_get_status = asyncio.Event().wait
+    healthy = MagicMock()
+
+    async def async_get_status() -> dict:
+        await asyncio.sleep(0.1)
+        return {"model": "SB6183"}
+
+    healthy.async_get_status = async_get_status
+
+    with patch(
+        "custom_components.arris_cablemodem.poller.FETCH_TOTAL_TIMEOUT", 0.2
+    ):
+        hung_fetches = [
+            asyncio.ensure_future(poller.async_fetch(hung))
+            for _ in range(FLEET_MAX_CONCURRENT_FETCHES)
+        ]
+        await asyncio.sleep(0)
+        assert await poller.async_fetch(healthy) == {"model": "SB6183"}
+        for fetch in hung_fetches:
+            with pytest.raises(asyncio.TimeoutError):
+                await fetch
+
+
+@pytest.mark.parametrize("due", [0, 3.2, 17.5, 1234.9])
+async def test_poll_slots_are_spaced(hass: HomeAssistant, due: float) -> None:
+    """Each modem owns an evenly spaced offset in the shortest interval."""
+    poller = ArrisFleetPoller(hass)
+    for entry_id in ("a", "b", "c", "d"):
+        poller.async_start(entry_id, _coordinator())
+    # A slower modem does not change the slot period
+    poller.async_start("e", MagicMock(min_interval=60, poll_interval=60))
+
+    slots = [
+        poller._next_slot(entry_id, poller._epoch + due)
+        for entry_id in ("a", "b", "c", "d", "e")
+    ]
+    for index, slot in enumerate(slots):
+        periods = (slot - poller._epoch - index * INTERVAL / 5) / INTERVAL
+        assert periods == pytest.approx(round(periods))
+        assert abs(slot - poller._epoch - due) <= INTERVAL / 2
+    assert len({round(slot, 6) for slot in slots}) == len(slots)
+
+    for entry_id in ("a", "b", "c", "d", "e"):
+        poller.async_remove(entry_id)
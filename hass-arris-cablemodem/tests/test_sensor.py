@@ -0,0 +1,89 @@
+"""Tests for the ARRIS sensor platform."""
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.arris_cablemodem import sensor
+from custom_components.arris_cablemodem.const import DOMAIN
+
+
+def _data(downstream: int, upstream: int) -> dict:
+    """Return coordinator data with the given number of bonded channels."""
+    return {
+        "model": "SB6183",
+        "channel_index": {
+            "downstream": {ch_num: None for ch_num in range(1, downstream + 1)},
+            "upstream": {ch_num: None for ch_num in range(1, upstream + 1)},
+        },
+    }
+
+
+async def test_channel_sensors_survive_reboot(hass: HomeAssistant) -> None:
+    """Channel sensors are kept, and not added again, across a reboot."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    coordinator = DataUpdateCoordinator(
+        hass, logging.getLogger(__name__), name="test"
+    )
+    coordinator.data = _data(4, 2)
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    added = []
+    await sensor.async_setup_entry(hass, entry, added.extend)
+    channel_ids = [
+        entity.unique_id
+        for entity in added
+        if isinstance(entity, sensor.ArrisChannelSensor)
+    ]
+    assert len(channel_ids) == len(set(channel_ids)) > 0
+
+    registry = er.async_get(hass)
+    for unique_id in channel_ids:
+        registry.async_get_or_create(
+            "sensor", DOMAIN, unique_id, config_entry=entry
+        )
+
+    # Rebooting: no channels are bonded
+    coordinator.async_set_updated_data(_data(0, 0))
+    # Recovered: the same channels are bonded again
+    coordinator.async_set_updated_data(_data(4, 2))
+
+    unique_ids = [entity.unique_id for entity in added]
+    assert len(unique_ids) == len(set(unique_ids))
+    assert all(
+        registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+        for unique_id in channel_ids
+    )
+
+
+async def test_registry_scanned_only_when_channels_drop(hass: HomeAssistant) -> None:
+    """The entity registry is only scanned at setup and when channels drop."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    coordinator = DataUpdateCoordinator(
+        hass, logging.getLogger(__name__), name="test"
+    )
+    coordinator.data = _data(4, 2)
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    added = []
+    with patch.object(
+        sensor,
+        "_async_remove_channel_sensors",
+        wraps=sensor._async_remove_channel_sensors,
+    ) as remove:
+        await sensor.async_setup_entry(hass, entry, added.extend)
+        assert remove.call_count == 1
+
+        coordinator.async_set_updated_data(_data(4, 2))
+        coordinator.async_set_updated_data(_data(5, 2))
+        assert remove.call_count == 1
+
+        coordinator.async_set_updated_data(_data(3, 2))
+        assert remove.call_count == 2